@@ -1,10 +1,13 @@
+import numpy as np
 import pandas as pd
 import joblib
 import os
 import matplotlib.pyplot as plt
 import seaborn as sns
+from sklearn.compose import ColumnTransformer
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import OneHotEncoder
 from sklearn.metrics import mean_absolute_error, r2_score
 
 
@@ -13,20 +16,18 @@ def main():
     print("Iniciando el entrenamiento del modelo...")
 
     # Definir rutas
-    input_path = "output/data/cleaned_cars.csv"
+    input_path = "output/data/cleaned_cars.parquet"
     model_dir = "models"
     plot_dir = "output/plots"
 
     if not os.path.exists(input_path):
         print(f"Error: No se encontró el archivo '{input_path}'.")
-        print("Por favor, ejecuta primero el script '01_data_loader.py'.")
+        print("Por favor, ejecuta primero el script 'data_cleaner.py'.")
         return
 
     os.makedirs(model_dir, exist_ok=True)
     os.makedirs(plot_dir, exist_ok=True)
 
-    df = pd.read_csv(input_path)
-
     # 1. Preparar datos para el modelo
     features = [
         "marca",
@@ -39,30 +40,65 @@ def main():
         "cantidad_extras",
     ]
     target = "precio_crc"
+    # Solo se leen del Parquet las columnas que usa el modelo
+    df = pd.read_parquet(input_path, columns=features + [target])
 
-    df_model = df[features + [target]].copy()
-
-    # Convertir categóricas a numéricas (One-Hot Encoding)
-    df_model = pd.get_dummies(
-        df_model,
-        columns=["marca", "modelo", "combustible", "transmision"],
-        drop_first=True,
-    )
+    # Descartar precios atípicos (0.5% en cada extremo) y kilometrajes irreales
+    lo, hi = df["precio_crc"].quantile([0.005, 0.995])
+    df = df.loc[df["precio_crc"].between(lo, hi) & (df["kilometraje"] < 1_000_000)]
 
-    X = df_model.drop(target, axis=1)
-    y = df_model[target]
+    categoricas = ["marca", "modelo", "combustible", "transmision"]
+    numericas = [f for f in features if f not in categoricas]
 
-    # Guardar las columnas del modelo para usarlas en la app
-    joblib.dump(X.columns, os.path.join(model_dir, "model_columns.pkl"))
+    X = df[features]
+    y = df[target]
 
     # 2. Dividir datos
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.2, random_state=42
     )
 
+    # Convertir categóricas a numéricas (One-Hot Encoding disperso, CSR).
+    # Los nombres de salida siguen el formato "<columna>_<valor>" que usa
+    # el dashboard para armar el vector de predicción.
+    encoder = ColumnTransformer(
+        [
+            (
+                "cat",
+                OneHotEncoder(
+                    drop="first",
+                    handle_unknown="ignore",
+                    sparse_output=True,
+                    dtype=np.float32,
+                ),
+                categoricas,
+            ),
+            ("num", "passthrough", numericas),
+        ],
+        sparse_threshold=1.0,
+        verbose_feature_names_out=False,
+    )
+    X_train = encoder.fit_transform(X_train)
+    X_test = encoder.transform(X_test)
+    model_columns = encoder.get_feature_names_out()
+
+    # Guardar las columnas del modelo para usarlas en la app (comprimido,
+    # como lista simple para no depender del tipo de índice al cargar)
+    joblib.dump(
+        list(model_columns), os.path.join(model_dir, "model_columns.pkl"), compress=3
+    )
+
     # 3. Entrenar el modelo
     print("Entrenando RandomForestRegressor...")
-    model = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
+    # max_features="sqrt" reduce las características evaluadas por división
+    # de D a √D, lo que acelera mucho la construcción de cada árbol
+    model = RandomForestRegressor(
+        n_estimators=200,
+        max_features="sqrt",
+        min_samples_leaf=5,
+        n_jobs=-1,
+        random_state=42,
+    )
     model.fit(X_train, y_train)
 
     # 4. Evaluar el modelo
@@ -77,22 +113,29 @@ def main():
     print("-" * 50)
 
     # 5. Guardar el modelo
-    joblib.dump(model, os.path.join(model_dir, "car_price_model.pkl"))
+    joblib.dump(model, os.path.join(model_dir, "car_price_model.pkl"), compress=3)
     print(f"Modelo guardado en: {os.path.join(model_dir, 'car_price_model.pkl')}")
 
     # 6. Importancia de Características
     importances = (
-        pd.Series(model.feature_importances_, index=X.columns)
+        pd.Series(model.feature_importances_, index=model_columns)
         .sort_values(ascending=False)
         .nlargest(20)
     )
-    plt.figure(figsize=(12, 8))
-    sns.barplot(x=importances.values, y=importances.index, palette="plasma")
-    plt.title("Top 20 Características más Importantes para el Precio", fontsize=16)
-    plt.xlabel("Importancia Relativa", fontsize=12)
-    plt.tight_layout()
-    plt.savefig(os.path.join(plot_dir, "feature_importance.png"))
-    plt.close()
+    fig, ax = plt.subplots(figsize=(12, 8))
+    sns.barplot(
+        x=importances.values,
+        y=importances.index,
+        hue=importances.index,
+        palette="plasma",
+        legend=False,
+        ax=ax,
+    )
+    ax.set_title("Top 20 Características más Importantes para el Precio", fontsize=16)
+    ax.set_xlabel("Importancia Relativa", fontsize=12)
+    fig.tight_layout()
+    fig.savefig(os.path.join(plot_dir, "feature_importance.png"))
+    plt.close(fig)
     print(f"Gráfico de importancia de características guardado en: {plot_dir}")
 
     print("✅ Proceso de modelado completado.")
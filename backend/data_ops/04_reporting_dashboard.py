@@ -1,68 +1,551 @@
 import dash
-from dash import dcc, html, Input, Output, State, dash_table
-import plotly.express as px
+from dash import dcc, html, Input, Output, State, Patch
+import dash_ag_grid as dag
+import plotly.graph_objects as go
+import plotly.io as pio
+import numpy as np
 import pandas as pd
-import joblib
+import contextlib
+import glob
+import hashlib
+import json
 import os
+import tempfile
 from datetime import datetime
+from functools import lru_cache
 import dash_bootstrap_components as dbc
 
 # --- 1. Carga de Datos y Archivos del Modelo ---
 print("Iniciando la carga de datos y modelos...")
-DATA_PATH = "output/data/cleaned_cars.csv"
+DATA_PATH = "output/data/cleaned_cars.parquet"
 MODEL_PATH = "models/car_price_model.pkl"
 COLUMNS_PATH = "models/model_columns.pkl"
+# Tablas resumen pre-calculadas por data_cleaner.py
+AGREGADOS_DIR = "output/data"
+SUMMARY_PATH = os.path.join(AGREGADOS_DIR, "price_summary.json")
+AGREGADOS_PATHS = {
+    nombre: os.path.join(AGREGADOS_DIR, f"{nombre}.parquet")
+    for nombre in ["stats_by_brand", "depreciation", "geo_counts", "geo_prices"]
+}
+# Figuras ya serializadas, reutilizadas entre arranques mientras los datos no cambien
+FIGURAS_CACHE_DIR = "output/cache"
+# Subirla al cambiar el código o los bins de una figura invalida la caché
+FIGURAS_CACHE_VERSION = 1
 
 # Verificación de la existencia de archivos necesarios
-if not all(os.path.exists(p) for p in [DATA_PATH, MODEL_PATH, COLUMNS_PATH]):
+if not all(
+    os.path.exists(p)
+    for p in [DATA_PATH, MODEL_PATH, COLUMNS_PATH, SUMMARY_PATH, *AGREGADOS_PATHS.values()]
+):
     print("--- ERROR ---")
     print(
-        "Faltan archivos necesarios (cleaned_cars.csv, car_price_model.pkl, o model_columns.pkl)."
+        "Faltan archivos necesarios (cleaned_cars.parquet, tablas resumen, car_price_model.pkl, o model_columns.pkl)."
     )
     print(
-        "Por favor, asegúrate de ejecutar los scripts 01_data_loader.py y 03_modeling.py antes de lanzar el dashboard."
+        "Por favor, asegúrate de ejecutar los scripts data_cleaner.py y 03_modeling.py antes de lanzar el dashboard."
     )
     exit()
 
-df = pd.read_csv(DATA_PATH)
-model = joblib.load(MODEL_PATH)
-model_columns = joblib.load(COLUMNS_PATH)
-print("Datos y modelos cargados correctamente.")
+# Solo las columnas que usa el dashboard: Parquet lee cada columna por separado
+DATA_COLUMNS = [
+    "precio_crc",
+    "kilometraje",
+    "marca",
+    "modelo",
+    "transmision",
+    "combustible",
+    "cantidad_extras",
+]
+df = pd.read_parquet(DATA_PATH, columns=DATA_COLUMNS)
+print("Datos cargados correctamente.")
+
+
+# El modelo (y con él joblib/sklearn) solo se carga con la primera predicción:
+# los workers que nunca usan esa pestaña no pagan su importación ni su memoria.
+@lru_cache(maxsize=1)
+def _load_model():
+    import joblib
+
+    model = joblib.load(MODEL_PATH)
+    # Las predicciones son de una sola fila: repartir los árboles entre hilos
+    # cuesta más que recorrerlos en serie
+    model.set_params(n_jobs=1)
+    model_columns = joblib.load(COLUMNS_PATH)
+    # Posición de cada columna one-hot/numérica en el vector de entrada
+    column_index = {name: i for i, name in enumerate(model_columns)}
+    return model, column_index
+
 
 # --- 2. Preparación de Datos para Análisis (Pre-cálculos) ---
 print("Realizando pre-cálculos para el dashboard...")
-# Estadísticas Generales
-avg_price_total = df["precio_crc"].mean()
-min_price_total = df["precio_crc"].min()
-max_price_total = df["precio_crc"].max()
-
-# Estadísticas por Marca
-stats_by_brand = (
-    df.groupby("marca")["precio_crc"].agg(["min", "max", "mean"]).round(0).reset_index()
-)
-stats_by_brand.columns = ["Marca", "Precio Mínimo", "Precio Máximo", "Precio Promedio"]
+# Estadísticas Generales, por marca, de depreciación y geográficas: se
+# leen ya agregadas en lugar de recalcular los groupby en cada arranque
+with open(SUMMARY_PATH, "r", encoding="utf-8") as f:
+    resumen = json.load(f)
+avg_price_total = resumen["avg_price_total"]
+min_price_total = resumen["min_price_total"]
+max_price_total = resumen["max_price_total"]
 
-# Datos para el cálculo de depreciación
+stats_by_brand = pd.read_parquet(AGREGADOS_PATHS["stats_by_brand"])
+# Indexada por (marca, modelo) para que el callback seleccione por clave
 depreciation_data = (
-    df.groupby(["marca", "modelo", "antiguedad"])["precio_crc"].mean().reset_index()
+    pd.read_parquet(AGREGADOS_PATHS["depreciation"])
+    .set_index(["marca", "modelo"])
+    .sort_index()
+)
+geo_counts = pd.read_parquet(AGREGADOS_PATHS["geo_counts"])
+geo_prices = pd.read_parquet(AGREGADOS_PATHS["geo_prices"])
+
+# Opciones de los dropdowns: marcas ordenadas y modelos por marca. "marca" es
+# categórica, así que las marcas salen de sus categorías sin recorrer las filas.
+MARCAS_SORTED = df["marca"].cat.categories.sort_values().tolist()
+MODELOS_POR_MARCA = (
+    df.groupby("marca", sort=False, observed=True)["modelo"]
+    .unique()
+    .apply(sorted)
+    .to_dict()
 )
+TRANSMISIONES = df["transmision"].cat.categories.tolist()
+
+# Valores fijos que la herramienta de predicción no pide al usuario.
+CURRENT_YEAR = datetime.now().year
+EXTRAS_MEAN = float(df["cantidad_extras"].mean())
+COMBUSTIBLE_MODE = df["combustible"].mode()[0]
+
+# Gráfico de depreciación con una sola traza: los callbacks solo reemplazan
+# sus datos y el título, sin reconstruir la figura en el navegador. Como las
+# demás figuras, se guarda ya convertida a dict para no re-serializarla.
+DEPRECIATION_PLACEHOLDER = (
+    "Seleccione una marca y modelo para ver su curva de depreciación"
+)
+depreciation_figure = go.Figure(
+    go.Scatter(x=[], y=[], mode="lines+markers"),
+    layout={
+        "title": {"text": DEPRECIATION_PLACEHOLDER},
+        "template": "plotly_white",
+        "xaxis_title": "Antigüedad (Años)",
+        "yaxis_title": "Precio Promedio (CRC)",
+    },
+).to_dict()
+
+
+def _cached_figure(nombre, builder, fuentes):
+    """Devuelve la figura `nombre` como dict, desde disco si sus fuentes no cambiaron.
+
+    La clave de la caché es FIGURAS_CACHE_VERSION junto con la fecha de
+    modificación y el tamaño de los archivos en `fuentes`; si no coincide, se
+    llama a `builder` y se guarda el resultado reemplazando la versión
+    anterior. Varios workers comparten el directorio: cada archivo se escribe
+    aparte y se mueve a su lugar con os.replace, de modo que nunca se lee una
+    figura a medio escribir.
+    """
+    firma = hashlib.md5(
+        repr(
+            [FIGURAS_CACHE_VERSION]
+            + [(p, os.stat(p).st_mtime_ns, os.stat(p).st_size) for p in fuentes]
+        ).encode()
+    ).hexdigest()[:12]
+    path = os.path.join(FIGURAS_CACHE_DIR, f"{nombre}.{firma}.json")
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            pass  # Archivo ilegible o borrado entre tanto: se reconstruye
+
+    contenido = pio.to_json(builder(), validate=False)
+    os.makedirs(FIGURAS_CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=FIGURAS_CACHE_DIR, prefix=f".{nombre}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(contenido)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    for anterior in glob.glob(os.path.join(FIGURAS_CACHE_DIR, f"{nombre}.*.json")):
+        if anterior != path:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(anterior)
+    # Mismo formato que un acierto de caché: tipos JSON, sin arrays de numpy
+    return json.loads(contenido)
+
+
+def _figura_distribucion_precios():
+    # Distribución de precios agrupada en 50 intervalos en el servidor
+    counts, edges = np.histogram(df["precio_crc"].to_numpy(), bins=50)
+    return go.Figure(
+        go.Bar(x=edges[:-1], y=counts, width=np.diff(edges), offset=0),
+        layout={
+            "title": "Distribución de Precios (CRC)",
+            "xaxis_title": "precio_crc",
+            "yaxis_title": "count",
+            "bargap": 0,
+        },
+    )
+
+
+def _figura_precio_km():
+    # Precio vs. kilometraje agregado en una grilla de 60x60 celdas: el
+    # navegador recibe solo los conteos en lugar de un punto por vehículo
+    counts, km_edges, precio_edges = np.histogram2d(
+        df["kilometraje"], df["precio_crc"], bins=60
+    )
+    return go.Figure(
+        go.Heatmap(
+            z=counts.T,
+            x=(km_edges[:-1] + km_edges[1:]) / 2,
+            y=(precio_edges[:-1] + precio_edges[1:]) / 2,
+            colorscale="Viridis",
+            colorbar={"title": "Vehículos"},
+        ),
+        layout={
+            "title": "Precio vs. Kilometraje",
+            "xaxis_title": "kilometraje",
+            "yaxis_title": "precio_crc",
+        },
+    )
+
 
-# Datos para el análisis geográfico
-geo_counts = df["provincia"].value_counts().reset_index()
-geo_counts.columns = ["Provincia", "Cantidad de Vehículos"]
-geo_prices = df.groupby("provincia")["precio_crc"].mean().reset_index()
-geo_prices.columns = ["Provincia", "Precio Promedio (CRC)"]
-geo_prices = geo_prices.sort_values("Precio Promedio (CRC)", ascending=False)
 print("Pre-cálculos completados.")
 
 # --- 3. Inicialización de la App Dash ---
-app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
+# Los componentes de cada pestaña se montan desde un callback, por lo que no
+# existen en el layout inicial. compress=True sirve las respuestas con gzip
+# (Flask-Compress): el JSON de las figuras se comprime muy bien.
+app = dash.Dash(
+    __name__,
+    external_stylesheets=[dbc.themes.BOOTSTRAP],
+    suppress_callback_exceptions=True,
+    compress=True,
+)
 server = app.server
 app.title = "Análisis de Autos Usados CR"
 
 # --- 4. Layout de la App ---
+# El contenido de cada pestaña se arma la primera vez que se abre (ver
+# render_tab): las figuras de las pestañas ocultas no se construyen ni se
+# envían al navegador con la carga inicial. Las figuras se guardan como dict
+# para que Dash no repita la conversión Figure -> JSON en cada petición.
+
+
+# Pestaña 1: Análisis General
+@lru_cache(maxsize=1)
+def _tab_general():
+    return [
+        dbc.Row(
+            [
+                dbc.Col(
+                    dbc.Card(
+                        dcc.Graph(
+                            figure=_cached_figure(
+                                "distribucion_precios",
+                                _figura_distribucion_precios,
+                                [DATA_PATH],
+                            )
+                        )
+                    ),
+                    width=12,
+                    lg=6,
+                    className="mt-4",
+                ),
+                dbc.Col(
+                    dbc.Card(
+                        dcc.Graph(
+                            figure=_cached_figure(
+                                "precio_vs_km", _figura_precio_km, [DATA_PATH]
+                            )
+                        )
+                    ),
+                    width=12,
+                    lg=6,
+                    className="mt-4",
+                ),
+            ]
+        )
+    ]
+
+
+# Pestaña 2: Análisis de Precios y Depreciación
+@lru_cache(maxsize=1)
+def _tab_precios():
+    return [
+        dbc.Row(
+            [
+                dbc.Col(
+                    dbc.Card(
+                        [
+                            dbc.CardHeader("Precio Promedio General"),
+                            dbc.CardBody(
+                                f"₡{avg_price_total:,.0f}",
+                                className="h3 text-center text-success",
+                            ),
+                        ]
+                    )
+                ),
+                dbc.Col(
+                    dbc.Card(
+                        [
+                            dbc.CardHeader("Precio Mínimo Registrado"),
+                            dbc.CardBody(
+                                f"₡{min_price_total:,.0f}",
+                                className="h3 text-center text-info",
+                            ),
+                        ]
+                    )
+                ),
+                dbc.Col(
+                    dbc.Card(
+                        [
+                            dbc.CardHeader("Precio Máximo Registrado"),
+                            dbc.CardBody(
+                                f"₡{max_price_total:,.0f}",
+                                className="h3 text-center text-danger",
+                            ),
+                        ]
+                    )
+                ),
+            ],
+            className="mt-4",
+        ),
+        dbc.Row(
+            dbc.Col(
+                dbc.Card(
+                    [
+                        html.H4(
+                            "Resumen de Precios por Marca",
+                            className="card-title text-center mt-3",
+                        ),
+                        dag.AgGrid(
+                            columnDefs=[
+                                {
+                                    "field": "Marca",
+                                    "filter": "agTextColumnFilter",
+                                },
+                                *(
+                                    {
+                                        "field": i,
+                                        "filter": "agNumberColumnFilter",
+                                        "valueFormatter": {
+                                            "function": "d3.format(',')(params.value)"
+                                        },
+                                    }
+                                    for i in stats_by_brand.columns[1:]
+                                ),
+                            ],
+                            rowData=stats_by_brand.to_dict("records"),
+                            defaultColDef={
+                                "sortable": True,
+                                "flex": 1,
+                            },
+                            dashGridOptions={
+                                "pagination": True,
+                                "paginationPageSize": 10,
+                                "paginationPageSizeSelector": False,
+                            },
+                            style={"height": 500},
+                        ),
+                    ],
+                    body=True,
+                ),
+                className="mt-4",
+            )
+        ),
+        dbc.Row(
+            dbc.Col(
+                dbc.Card(
+                    [
+                        html.H4(
+                            "Calculadora de Depreciación por Modelo",
+                            className="card-title text-center mt-3",
+                        ),
+                        dbc.Row(
+                            [
+                                dbc.Col(
+                                    dcc.Dropdown(
+                                        id="brand-depreciation-dropdown",
+                                        options=MARCAS_SORTED,
+                                        placeholder="1. Seleccione una marca...",
+                                    )
+                                ),
+                                dbc.Col(
+                                    dcc.Dropdown(
+                                        id="model-depreciation-dropdown",
+                                        placeholder="2. Seleccione un modelo...",
+                                    )
+                                ),
+                            ],
+                            className="m-3",
+                        ),
+                        dcc.Graph(
+                            id="depreciation-chart",
+                            figure=depreciation_figure,
+                        ),
+                    ],
+                    body=True,
+                ),
+                className="mt-4",
+            )
+        ),
+    ]
+
+
+# Pestaña 3: Análisis Geográfico
+@lru_cache(maxsize=1)
+def _tab_geografico():
+    return [
+        dbc.Row(
+            [
+                dbc.Col(
+                    dbc.Card(
+                        dcc.Graph(
+                            figure=go.Figure(
+                                go.Bar(
+                                    x=geo_counts["Provincia"].astype(str),
+                                    y=geo_counts["Cantidad de Vehículos"],
+                                    texttemplate="%{y}",
+                                ),
+                                layout={
+                                    "title": "Cantidad de Vehículos por Provincia",
+                                    "xaxis_title": "Provincia",
+                                    "yaxis_title": "Cantidad de Vehículos",
+                                },
+                            ).to_dict()
+                        )
+                    ),
+                    width=12,
+                    lg=6,
+                    className="mt-4",
+                ),
+                dbc.Col(
+                    dbc.Card(
+                        dcc.Graph(
+                            figure=go.Figure(
+                                go.Bar(
+                                    x=geo_prices["Provincia"].astype(str),
+                                    y=geo_prices["Precio Promedio (CRC)"],
+                                    texttemplate="%{y:.2s}",
+                                ),
+                                layout={
+                                    "title": "Precio Promedio por Provincia",
+                                    "xaxis_title": "Provincia",
+                                    "yaxis_title": "Precio Promedio (CRC)",
+                                },
+                            ).to_dict()
+                        )
+                    ),
+                    width=12,
+                    lg=6,
+                    className="mt-4",
+                ),
+            ]
+        )
+    ]
+
+
+# Pestaña 4: Herramienta de Predicción
+@lru_cache(maxsize=1)
+def _tab_prediccion():
+    return [
+        dbc.Card(
+            dbc.CardBody(
+                [
+                    html.H3(
+                        "Estima el valor de un vehículo",
+                        className="card-title text-center",
+                    ),
+                    html.Hr(),
+                    dbc.Row(
+                        [
+                            dbc.Col(
+                                [
+                                    dbc.Label(
+                                        "Marca:",
+                                        html_for="marca-dropdown",
+                                    ),
+                                    dcc.Dropdown(
+                                        id="marca-dropdown",
+                                        options=MARCAS_SORTED,
+                                    ),
+                                    dbc.Label(
+                                        "Año:",
+                                        html_for="año-input",
+                                        className="mt-3",
+                                    ),
+                                    dbc.Input(
+                                        id="año-input",
+                                        type="number",
+                                        placeholder=f"Ej: {CURRENT_YEAR - 3}",
+                                    ),
+                                    dbc.Label(
+                                        "Cilindrada (cc):",
+                                        html_for="cilindrada-input",
+                                        className="mt-3",
+                                    ),
+                                    dbc.Input(
+                                        id="cilindrada-input",
+                                        type="number",
+                                        placeholder="Ej: 1800",
+                                    ),
+                                ],
+                                md=6,
+                            ),
+                            dbc.Col(
+                                [
+                                    dbc.Label(
+                                        "Modelo:",
+                                        html_for="modelo-dropdown",
+                                    ),
+                                    dcc.Dropdown(id="modelo-dropdown"),
+                                    dbc.Label(
+                                        "Kilometraje:",
+                                        html_for="kilometraje-input",
+                                        className="mt-3",
+                                    ),
+                                    dbc.Input(
+                                        id="kilometraje-input",
+                                        type="number",
+                                        placeholder="Ej: 50000",
+                                    ),
+                                    dbc.Label(
+                                        "Tipo de Transmisión:",
+                                        html_for="transmision-dropdown",
+                                        className="mt-3",
+                                    ),
+                                    dcc.Dropdown(
+                                        id="transmision-dropdown",
+                                        options=TRANSMISIONES,
+                                    ),
+                                ],
+                                md=6,
+                            ),
+                        ]
+                    ),
+                    dbc.Button(
+                        "Predecir Precio",
+                        id="predict-button",
+                        n_clicks=0,
+                        color="primary",
+                        className="w-100 mt-4 py-2 fs-5",
+                    ),
+                    html.Div(
+                        id="prediction-output",
+                        className="text-center h3 mt-4 p-3 border rounded",
+                    ),
+                ]
+            ),
+            className="mt-4",
+        )
+    ]
+
+
 app.layout = dbc.Container(
     [
+        # Mapa marca -> modelos para los dropdowns, resuelto en el navegador
+        dcc.Store(id="brand-models", data=MODELOS_POR_MARCA),
         # Título Principal
         dbc.Row(
             dbc.Col(
@@ -76,305 +559,31 @@ app.layout = dbc.Container(
         # Sistema de Pestañas
         dbc.Tabs(
             id="tabs-principal",
+            active_tab="tab-general",
             children=[
                 # Pestaña 1: Análisis General
                 dbc.Tab(
                     label="📊 Análisis General",
-                    children=[
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    dbc.Card(
-                                        dcc.Graph(
-                                            figure=px.histogram(
-                                                df,
-                                                x="precio_crc",
-                                                title="Distribución de Precios (CRC)",
-                                            )
-                                        )
-                                    ),
-                                    width=12,
-                                    lg=6,
-                                    className="mt-4",
-                                ),
-                                dbc.Col(
-                                    dbc.Card(
-                                        dcc.Graph(
-                                            figure=px.scatter(
-                                                df,
-                                                x="kilometraje",
-                                                y="precio_crc",
-                                                hover_data=["marca", "modelo"],
-                                                title="Precio vs. Kilometraje",
-                                            )
-                                        )
-                                    ),
-                                    width=12,
-                                    lg=6,
-                                    className="mt-4",
-                                ),
-                            ]
-                        )
-                    ],
+                    tab_id="tab-general",
                 ),
                 # Pestaña 2: Análisis de Precios y Depreciación
                 dbc.Tab(
                     label="💰 Análisis de Precios y Depreciación",
-                    children=[
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
-                                            dbc.CardHeader("Precio Promedio General"),
-                                            dbc.CardBody(
-                                                f"₡{avg_price_total:,.0f}",
-                                                className="h3 text-center text-success",
-                                            ),
-                                        ]
-                                    )
-                                ),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
-                                            dbc.CardHeader("Precio Mínimo Registrado"),
-                                            dbc.CardBody(
-                                                f"₡{min_price_total:,.0f}",
-                                                className="h3 text-center text-info",
-                                            ),
-                                        ]
-                                    )
-                                ),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
-                                            dbc.CardHeader("Precio Máximo Registrado"),
-                                            dbc.CardBody(
-                                                f"₡{max_price_total:,.0f}",
-                                                className="h3 text-center text-danger",
-                                            ),
-                                        ]
-                                    )
-                                ),
-                            ],
-                            className="mt-4",
-                        ),
-                        dbc.Row(
-                            dbc.Col(
-                                dbc.Card(
-                                    [
-                                        html.H4(
-                                            "Resumen de Precios por Marca",
-                                            className="card-title text-center mt-3",
-                                        ),
-                                        dash_table.DataTable(
-                                            columns=[
-                                                {
-                                                    "name": i,
-                                                    "id": i,
-                                                    "type": "numeric",
-                                                    "format": dash_table.Format.Format(
-                                                        group=","
-                                                    ),
-                                                }
-                                                for i in stats_by_brand.columns
-                                            ],
-                                            data=stats_by_brand.to_dict("records"),
-                                            style_cell={"textAlign": "left"},
-                                            style_header={
-                                                "backgroundColor": "lightgrey",
-                                                "fontWeight": "bold",
-                                            },
-                                            page_size=10,
-                                            sort_action="native",
-                                            filter_action="native",
-                                        ),
-                                    ],
-                                    body=True,
-                                ),
-                                className="mt-4",
-                            )
-                        ),
-                        dbc.Row(
-                            dbc.Col(
-                                dbc.Card(
-                                    [
-                                        html.H4(
-                                            "Calculadora de Depreciación por Modelo",
-                                            className="card-title text-center mt-3",
-                                        ),
-                                        dbc.Row(
-                                            [
-                                                dbc.Col(
-                                                    dcc.Dropdown(
-                                                        id="brand-depreciation-dropdown",
-                                                        options=sorted(
-                                                            df["marca"].unique()
-                                                        ),
-                                                        placeholder="1. Seleccione una marca...",
-                                                    )
-                                                ),
-                                                dbc.Col(
-                                                    dcc.Dropdown(
-                                                        id="model-depreciation-dropdown",
-                                                        placeholder="2. Seleccione un modelo...",
-                                                    )
-                                                ),
-                                            ],
-                                            className="m-3",
-                                        ),
-                                        dcc.Graph(id="depreciation-chart"),
-                                    ],
-                                    body=True,
-                                ),
-                                className="mt-4",
-                            )
-                        ),
-                    ],
+                    tab_id="tab-precios",
                 ),
                 # Pestaña 3: Análisis Geográfico
                 dbc.Tab(
                     label="🗺️ Análisis Geográfico",
-                    children=[
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    dbc.Card(
-                                        dcc.Graph(
-                                            figure=px.bar(
-                                                geo_counts,
-                                                x="Provincia",
-                                                y="Cantidad de Vehículos",
-                                                title="Cantidad de Vehículos por Provincia",
-                                                text_auto=True,
-                                            )
-                                        )
-                                    ),
-                                    width=12,
-                                    lg=6,
-                                    className="mt-4",
-                                ),
-                                dbc.Col(
-                                    dbc.Card(
-                                        dcc.Graph(
-                                            figure=px.bar(
-                                                geo_prices,
-                                                x="Provincia",
-                                                y="Precio Promedio (CRC)",
-                                                title="Precio Promedio por Provincia",
-                                                text_auto=".2s",
-                                            )
-                                        )
-                                    ),
-                                    width=12,
-                                    lg=6,
-                                    className="mt-4",
-                                ),
-                            ]
-                        )
-                    ],
+                    tab_id="tab-geografico",
                 ),
                 # Pestaña 4: Herramienta de Predicción
                 dbc.Tab(
                     label="🔮 Herramienta de Predicción",
-                    children=[
-                        dbc.Card(
-                            dbc.CardBody(
-                                [
-                                    html.H3(
-                                        "Estima el valor de un vehículo",
-                                        className="card-title text-center",
-                                    ),
-                                    html.Hr(),
-                                    dbc.Row(
-                                        [
-                                            dbc.Col(
-                                                [
-                                                    dbc.Label(
-                                                        "Marca:",
-                                                        html_for="marca-dropdown",
-                                                    ),
-                                                    dcc.Dropdown(
-                                                        id="marca-dropdown",
-                                                        options=sorted(
-                                                            df["marca"].unique()
-                                                        ),
-                                                    ),
-                                                    dbc.Label(
-                                                        "Año:",
-                                                        html_for="año-input",
-                                                        className="mt-3",
-                                                    ),
-                                                    dbc.Input(
-                                                        id="año-input",
-                                                        type="number",
-                                                        placeholder=f"Ej: {datetime.now().year - 3}",
-                                                    ),
-                                                    dbc.Label(
-                                                        "Cilindrada (cc):",
-                                                        html_for="cilindrada-input",
-                                                        className="mt-3",
-                                                    ),
-                                                    dbc.Input(
-                                                        id="cilindrada-input",
-                                                        type="number",
-                                                        placeholder="Ej: 1800",
-                                                    ),
-                                                ],
-                                                md=6,
-                                            ),
-                                            dbc.Col(
-                                                [
-                                                    dbc.Label(
-                                                        "Modelo:",
-                                                        html_for="modelo-dropdown",
-                                                    ),
-                                                    dcc.Dropdown(id="modelo-dropdown"),
-                                                    dbc.Label(
-                                                        "Kilometraje:",
-                                                        html_for="kilometraje-input",
-                                                        className="mt-3",
-                                                    ),
-                                                    dbc.Input(
-                                                        id="kilometraje-input",
-                                                        type="number",
-                                                        placeholder="Ej: 50000",
-                                                    ),
-                                                    dbc.Label(
-                                                        "Tipo de Transmisión:",
-                                                        html_for="transmision-dropdown",
-                                                        className="mt-3",
-                                                    ),
-                                                    dcc.Dropdown(
-                                                        id="transmision-dropdown",
-                                                        options=df[
-                                                            "transmision"
-                                                        ].unique(),
-                                                    ),
-                                                ],
-                                                md=6,
-                                            ),
-                                        ]
-                                    ),
-                                    dbc.Button(
-                                        "Predecir Precio",
-                                        id="predict-button",
-                                        n_clicks=0,
-                                        color="primary",
-                                        className="w-100 mt-4 py-2 fs-5",
-                                    ),
-                                    html.Div(
-                                        id="prediction-output",
-                                        className="text-center h3 mt-4 p-3 border rounded",
-                                    ),
-                                ]
-                            ),
-                            className="mt-4",
-                        )
-                    ],
+                    tab_id="tab-prediccion",
                 ),
             ],
         ),
+        html.Div(id="tab-content"),
     ],
     fluid=True,
 )
@@ -383,15 +592,64 @@ app.layout = dbc.Container(
 # --- 5. Callbacks de la App (Lógica Interactiva) ---
 
 
+TAB_BUILDERS = {
+    "tab-general": _tab_general,
+    "tab-precios": _tab_precios,
+    "tab-geografico": _tab_geografico,
+    "tab-prediccion": _tab_prediccion,
+}
+
+
+# Callback para montar el contenido de la pestaña activa
+@app.callback(Output("tab-content", "children"), Input("tabs-principal", "active_tab"))
+def render_tab(active_tab):
+    return TAB_BUILDERS[active_tab]()
+
+
+# Los dropdowns de modelos solo copian una lista estática: se resuelven en el
+# navegador a partir de "brand-models" sin ida y vuelta al servidor
+MODEL_OPTIONS_JS = """
+function(marca, modelosPorMarca) {
+    const modelos = (marca && modelosPorMarca[marca]) || [];
+    return modelos.map(m => ({label: m, value: m}));
+}
+"""
+
 # Callback para actualizar el dropdown de modelos en la pestaña de predicción
-@app.callback(Output("modelo-dropdown", "options"), Input("marca-dropdown", "value"))
-def set_prediction_model_options(selected_marca):
-    if not selected_marca:
-        return []
-    return [
-        {"label": i, "value": i}
-        for i in sorted(df[df["marca"] == selected_marca]["modelo"].unique())
-    ]
+app.clientside_callback(
+    MODEL_OPTIONS_JS,
+    Output("modelo-dropdown", "options"),
+    Input("marca-dropdown", "value"),
+    State("brand-models", "data"),
+)
+
+
+# Las entradas repetidas devuelven el precio ya calculado sin recorrer los árboles
+@lru_cache(maxsize=4096)
+def _predict_cached(antiguedad, kilometraje, cilindrada, marca, modelo, transmision):
+    model, column_index = _load_model()
+    x = np.zeros(len(column_index), dtype=np.float32)
+    numericas = {
+        "antiguedad": antiguedad,
+        "kilometraje": kilometraje,
+        "cilindrada": cilindrada,
+        "cantidad_extras": EXTRAS_MEAN,  # Usamos un promedio para simplificar
+    }
+    for col, valor in numericas.items():
+        x[column_index[col]] = valor
+    categoricas = {
+        "marca": marca,
+        "modelo": modelo,
+        "transmision": transmision,
+        "combustible": COMBUSTIBLE_MODE,  # Usamos el más común para simplificar
+    }
+    for col, valor in categoricas.items():
+        # La categoría base (drop_first) y las no vistas no tienen columna
+        idx = column_index.get(f"{col}_{valor}")
+        if idx is not None:
+            x[idx] = 1
+
+    return float(model.predict(x.reshape(1, -1))[0])
 
 
 # Callback para la predicción de precios
@@ -413,43 +671,38 @@ def predict_price(n_clicks, marca, modelo, año, kilometraje, cilindrada, transm
     if not all([marca, modelo, año, kilometraje, cilindrada, transmision]):
         return "⚠️ Por favor, complete todos los campos."
 
-    antiguedad = max(0, datetime.now().year - año)
-    input_df = pd.DataFrame(
-        {
-            "antiguedad": [antiguedad],
-            "kilometraje": [kilometraje],
-            "cilindrada": [cilindrada],
-            "marca": [marca],
-            "modelo": [modelo],
-            "transmision": [transmision],
-            "cantidad_extras": [
-                df["cantidad_extras"].mean()
-            ],  # Usamos un promedio para simplificar
-            "combustible": [
-                df["combustible"].mode()[0]
-            ],  # Usamos el más común para simplificar
-        }
+    prediction = _predict_cached(
+        max(0, CURRENT_YEAR - año), kilometraje, cilindrada, marca, modelo, transmision
     )
-
-    input_df_encoded = pd.get_dummies(input_df)
-    input_df_aligned = input_df_encoded.reindex(columns=model_columns, fill_value=0)
-
-    prediction = model.predict(input_df_aligned)[0]
     return f"Precio Estimado: ₡{prediction:,.0f}"
 
 
 # Callback para actualizar el dropdown de modelos en la pestaña de depreciación
-@app.callback(
+app.clientside_callback(
+    MODEL_OPTIONS_JS,
     Output("model-depreciation-dropdown", "options"),
     Input("brand-depreciation-dropdown", "value"),
+    State("brand-models", "data"),
 )
-def set_depreciation_model_options(selected_marca):
-    if not selected_marca:
-        return []
-    return [
-        {"label": i, "value": i}
-        for i in sorted(df[df["marca"] == selected_marca]["modelo"].unique())
-    ]
+
+
+# Solo hay una curva posible por (marca, modelo): se calcula una vez
+@lru_cache(maxsize=1024)
+def _depreciation_series(selected_brand, selected_model):
+    try:
+        filtered_data = depreciation_data.loc[[(selected_brand, selected_model)]]
+    except KeyError:
+        filtered_data = depreciation_data.iloc[:0]
+
+    if len(filtered_data) < 2:
+        title = f"No hay suficientes datos para graficar la depreciación de {selected_model}"
+        return [], [], title
+
+    return (
+        filtered_data["antiguedad"].tolist(),
+        filtered_data["precio_crc"].tolist(),
+        f"Curva de Depreciación para {selected_brand} {selected_model}",
+    )
 
 
 # Callback para actualizar el gráfico de depreciación
@@ -460,39 +713,15 @@ def set_depreciation_model_options(selected_marca):
 )
 def update_depreciation_chart(selected_model, selected_brand):
     if not selected_model or not selected_brand:
-        return px.line(
-            title="Seleccione una marca y modelo para ver su curva de depreciación",
-            template="plotly_white",
-        )
-
-    filtered_data = depreciation_data[
-        (depreciation_data["marca"] == selected_brand)
-        & (depreciation_data["modelo"] == selected_model)
-    ]
+        x, y, title = [], [], DEPRECIATION_PLACEHOLDER
+    else:
+        x, y, title = _depreciation_series(selected_brand, selected_model)
 
-    if len(filtered_data) < 2:
-        return px.line(
-            title=f"No hay suficientes datos para graficar la depreciación de {selected_model}",
-            template="plotly_white",
-        )
-
-    fig = px.line(
-        filtered_data,
-        x="antiguedad",
-        y="precio_crc",
-        title=f"Curva de Depreciación para {selected_brand} {selected_model}",
-        labels={
-            "antiguedad": "Antigüedad (Años)",
-            "precio_crc": "Precio Promedio (CRC)",
-        },
-        markers=True,
-    )
-    fig.update_layout(
-        template="plotly_white",
-        yaxis_title="Precio Promedio (CRC)",
-        xaxis_title="Antigüedad (Años)",
-    )
-    return fig
+    patch = Patch()
+    patch["data"][0]["x"] = x
+    patch["data"][0]["y"] = y
+    patch["layout"]["title"]["text"] = title
+    return patch
 
 
 # --- 6. Ejecución del Servidor ---
@@ -1,13 +1,46 @@
 import os
 import glob
 import json
+import multiprocessing as mp
 from datetime import datetime
 
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CURRENT_YEAR = datetime.now().year
+OUTPUT_PATH = "output/data/cleaned_cars.parquet"
+AGREGADOS_DIR = "output/data"
+PROGRESO_CADA = 1000
+CATEGORICAS = ["marca", "modelo", "combustible", "transmision", "provincia", "estilo"]
+
+
+# Mismo formato que data_scrapper/json_io.py (UTF-8, sangría de dos espacios).
+# Se copia en lugar de importarlo: importar data_scrapper carga también los
+# scrapers (playwright, typesense), que el limpiador no necesita.
+def load_json(filename):
+    if orjson is not None:
+        with open(filename, "rb") as f:
+            return orjson.loads(f.read())
+    with open(filename, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_json(data, filename):
+    if orjson is not None:
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
 
 def corregir_json(file_path):
     """Corrige un archivo JSON según las reglas definidas y lo sobrescribe."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(file_path)
 
     # 1. Intercambiar precios si están invertidos
     precio_crc = data.get("precio_usd")
@@ -36,17 +69,137 @@ def corregir_json(file_path):
 
     # 4. Calcular antigüedad (opcional)
     if data["año"]:
-        current_year = datetime.now().year
-        antiguedad = current_year - data["año"]
-        if antiguedad < 0:
-            antiguedad = 0
-        data["antiguedad"] = antiguedad
+        data["antiguedad"] = max(0, CURRENT_YEAR - data["año"])
 
     # 5. Sobrescribir el JSON con las correcciones
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
-
-    print(f"✅ Corregido: {file_path}")
+    save_json(data, file_path)
+
+    return data
+
+
+# Ruta aplanada por json_normalize -> nombre de columna del dataset limpio.
+COLUMNAS = {
+    "marca": "marca",
+    "modelo": "modelo",
+    "año": "año",
+    "antiguedad": "antiguedad",
+    "precio_crc": "precio_crc",
+    "precio_usd": "precio_usd",
+    "informacion_general.kilometraje_number": "kilometraje",
+    "informacion_general.cilindrada_number": "cilindrada",
+    "informacion_general.combustible": "combustible",
+    "informacion_general.transmisión": "transmision",
+    "informacion_general.provincia": "provincia",
+    "informacion_general.estilo": "estilo",
+}
+
+
+def guardar_dataset(vehiculos, output_path=OUTPUT_PATH):
+    """Construye la tabla limpia y la guarda en Parquet para los scripts 03 y 04."""
+    raw = pd.json_normalize(vehiculos)
+    df = raw.reindex(columns=list(COLUMNAS)).rename(columns=COLUMNAS)
+    if "equipamiento" in raw:
+        df["cantidad_extras"] = raw["equipamiento"].str.len().fillna(0).astype(int)
+    else:
+        df["cantidad_extras"] = 0
+    for col in ["año", "antiguedad", "precio_crc", "precio_usd", "kilometraje", "cilindrada"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df = df.dropna(subset=["precio_crc", "año"])
+    df = df[df["año"] > 0]
+
+    medianas = df[["kilometraje", "cilindrada"]].median()
+    df = df.fillna(
+        {
+            "kilometraje": medianas["kilometraje"],
+            "cilindrada": medianas["cilindrada"],
+            **{col: "Desconocido" for col in CATEGORICAS},
+        }
+    )
+    # Las columnas de texto repiten pocos valores: como categorías ocupan
+    # códigos enteros y Parquet conserva la codificación por diccionario.
+    df = df.astype({col: "category" for col in CATEGORICAS})
+    # Los precios quedan en float64: float32 redondea todo valor sobre
+    # 16.777.216, es decir, casi cualquier precio en colones. Solo km y cc
+    # caben sin pérdida en float32.
+    df = df.astype(
+        {
+            "año": "int16",
+            "antiguedad": "int16",
+            "precio_crc": "float64",
+            "precio_usd": "float64",
+            "kilometraje": "float32",
+            "cilindrada": "float32",
+            "cantidad_extras": "int16",
+        }
+    )
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    df.to_parquet(output_path, index=False, compression="snappy")
+    return df
+
+
+def guardar_agregados(df, output_dir=AGREGADOS_DIR):
+    """Pre-calcula las tablas resumen del dashboard para no repetirlas al iniciar."""
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Estadísticas Generales
+    precios = df["precio_crc"].agg(["mean", "min", "max"])
+    resumen = {
+        "avg_price_total": float(precios["mean"]),
+        "min_price_total": float(precios["min"]),
+        "max_price_total": float(precios["max"]),
+    }
+    save_json(resumen, os.path.join(output_dir, "price_summary.json"))
+
+    # Estadísticas por Marca
+    stats_by_brand = (
+        df.groupby("marca", observed=True)["precio_crc"]
+        .agg(["min", "max", "mean"])
+        .round(0)
+        .reset_index()
+    )
+    stats_by_brand.columns = ["Marca", "Precio Mínimo", "Precio Máximo", "Precio Promedio"]
+
+    # Datos para el cálculo de depreciación
+    # Se mantiene el orden por antigüedad: es el eje x de la curva
+    depreciation_data = (
+        df.groupby(["marca", "modelo", "antiguedad"], observed=True)["precio_crc"]
+        .mean()
+        .reset_index()
+    )
+
+    # Datos para el análisis geográfico
+    # Una sola pasada por provincia para la cantidad y el precio promedio
+    geo = (
+        df.groupby("provincia", sort=False, observed=True)
+        .agg(
+            **{
+                "Cantidad de Vehículos": ("precio_crc", "size"),
+                "Precio Promedio (CRC)": ("precio_crc", "mean"),
+            }
+        )
+        .rename_axis("Provincia")
+        .reset_index()
+    )
+    geo_counts = geo[["Provincia", "Cantidad de Vehículos"]].sort_values(
+        "Cantidad de Vehículos", ascending=False
+    )
+    geo_prices = geo[["Provincia", "Precio Promedio (CRC)"]].sort_values(
+        "Precio Promedio (CRC)", ascending=False
+    )
+
+    tablas = {
+        "stats_by_brand": stats_by_brand,
+        "depreciation": depreciation_data,
+        "geo_counts": geo_counts,
+        "geo_prices": geo_prices,
+    }
+    for nombre, tabla in tablas.items():
+        tabla.to_parquet(
+            os.path.join(output_dir, f"{nombre}.parquet"),
+            index=False,
+            compression="snappy",
+        )
 
 
 def main():
@@ -59,11 +212,24 @@ def main():
 
     print(f"Se encontraron {len(json_files)} archivos JSON para corregir...")
 
-    for file in json_files:
-        corregir_json(file)
+    # Cada archivo es independiente: se reparten entre todos los núcleos.
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(json_files) // (workers * 4))
+    # El progreso se informa por bloques y no por archivo, para no saturar stdout.
+    vehiculos = []
+    with mp.Pool(processes=workers) as pool:
+        for data in pool.imap_unordered(corregir_json, json_files, chunksize=chunksize):
+            vehiculos.append(data)
+            if len(vehiculos) % PROGRESO_CADA == 0:
+                print(f"✅ Corregidos {len(vehiculos)}/{len(json_files)} archivos...")
+
+    df = guardar_dataset(vehiculos)
+    guardar_agregados(df)
 
     print("-" * 50)
     print("✅ Proceso completado. Todos los archivos fueron corregidos.")
+    print(f"Dataset limpio ({len(df)} vehículos) guardado en: {OUTPUT_PATH}")
+    print(f"Tablas resumen del dashboard guardadas en: {AGREGADOS_DIR}")
     print("-" * 50)
 
 
@@ -0,0 +1,34 @@
+"""
+JSON file helpers shared by the scrapers (data_ops/data_cleaner.py keeps a
+copy, so it runs without the scraper dependencies).
+
+orjson is used when installed and the stdlib json module otherwise. Both
+paths write the same layout (UTF-8, two-space indent), so a data file does
+not change format depending on which library wrote it.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def save_json(data, filename):
+    if orjson is not None:
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def load_json(filename):
+    """Load a JSON file; raises json.JSONDecodeError on malformed content."""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        with open(filename, "rb") as f:
+            return orjson.loads(f.read())
+    with open(filename, "r", encoding="utf-8") as f:
+        return json.load(f)
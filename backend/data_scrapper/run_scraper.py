@@ -63,6 +63,7 @@ HEADLESS = os.environ.get("SCRAPER_HEADLESS", "true").lower() not in ("false", "
 INITIAL_CONCURRENCY = int(os.environ.get("SCRAPER_INITIAL_CONCURRENCY", "3"))
 MIN_CONCURRENCY = int(os.environ.get("SCRAPER_MIN_CONCURRENCY", "1"))
 MAX_CONCURRENCY = int(os.environ.get("SCRAPER_MAX_CONCURRENCY", "10"))
+REQUESTS_PER_SECOND = float(os.environ.get("SCRAPER_REQUESTS_PER_SECOND", "2"))
 
 # ---------------------------------------------------------------------------
 # Graceful shutdown
@@ -157,6 +158,7 @@ async def run_details(repo: ScraperRepository, run_id: int) -> str:  # noqa: ARG
             initial_concurrency=INITIAL_CONCURRENCY,
             min_concurrency=MIN_CONCURRENCY,
             max_concurrency=MAX_CONCURRENCY,
+            requests_per_second=REQUESTS_PER_SECOND,
             shutdown_event=_shutdown_event,
         )
     except Exception as exc:
@@ -9,15 +9,14 @@ JSON files in datos_vehiculos/.
 """
 
 import asyncio
-import json
 import logging
 import os
 import random
 import re
 import time
 from collections import deque
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
-from urllib.parse import parse_qs, urlparse
 
 import argparse
 from playwright.async_api import async_playwright
@@ -28,6 +27,12 @@ try:
 except ImportError:
     ScraperRepository = None  # type: ignore[assignment,misc]
 
+# Works both inside the package and when run as a script from this folder
+try:
+    from data_scrapper.json_io import load_json, save_json
+except ImportError:
+    from json_io import load_json, save_json
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -38,7 +43,12 @@ logging.basicConfig(
 # ---------------------------------------------------------------------------
 
 OUTPUT_DIR = "datos_vehiculos"   # standalone fallback
+# Cookies (including the consent choice) saved at the end of a run and loaded
+# into the next one, so new contexts start past the consent dialog
+STORAGE_STATE_FILE = "playwright_state.json"
 TRIES = 3
+ADJUST_INTERVAL = 20  # seconds between regular concurrency adjustments
+ERROR_BURST = 5       # errors within an interval that trigger an early one
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -68,11 +78,95 @@ MARCAS = [
     "VOLVO", "WESTERN STAR", "YUGO", "ZOTYE",
 ]
 
+# Anchored alternation, longest names first so that "DODGE/RAM" wins over
+# "DODGE" and "RAMBLER" over "RAM"; the brand must end at a word boundary.
+_MARCA_RE = re.compile(
+    r"(%s)(?!\w)" % "|".join(map(re.escape, sorted(MARCAS, key=len, reverse=True))),
+    re.IGNORECASE,
+)
+
+# Precompiled cleanup patterns used on every detail page
+_NON_DIGITS_RE = re.compile(r"[^\d]")
+_NON_DECIMAL_RE = re.compile(r"[^\d.]")
+_WS_RE = re.compile(r"\s+")
+# Car ID: the non-empty "c" query parameter of a cardetail.cfm URL
+_CAR_ID_RE = re.compile(r"[?&]c=([^&#]+)")
+
+# CSS (plus Playwright's :has-text) instead of XPath, so the browser's native
+# selector engine does the matching
+_SELLER_TABLE_SELECTOR = 'table:has(td:has-text("Vendedor"))'
+_EQUIPMENT_TABLE_SELECTOR = "table.table.table-bordered.border-top.table-striped"
+
+# In-page extraction scripts: each table or list is read with a single
+# evaluate_all instead of one bridge call per row and cell.
+# Text and bgcolor of every cell in each row
+_GENERAL_ROWS_JS = """rows => rows.map(r => Array.from(
+    r.querySelectorAll("td"), c => [c.innerText, c.getAttribute("bgcolor")]
+))"""
+# Cell texts of every row in the matched tables (a row is listed once even
+# when nested tables both match)
+_SELLER_ROWS_JS = """tables => [...new Set(tables.flatMap(t => [...t.querySelectorAll("tr")]))]
+    .map(r => Array.from(r.querySelectorAll("td"), c => c.innerText))"""
+# Names of the two-cell rows whose second cell holds a check icon
+_EQUIPMENT_JS = """tables => [...new Set(tables.flatMap(t => [...t.querySelectorAll("tbody tr")]))]
+    .map(r => r.querySelectorAll("td"))
+    .filter(c => c.length === 2 && c[1].querySelector("i.icon-check"))
+    .map(c => c[0].innerText)"""
+_GALLERY_JS = """imgs => imgs.map(i => i.getAttribute("src"))"""
+
+# No GPU process, no reliance on the small /dev/shm of containers, and images
+# are never requested, so they do not even reach the route handler
+_LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# Detail data is read from the HTML; these are never needed
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+# Third-party analytics and ad hosts loaded by every detail page
+_BLOCKED_HOSTS_RE = re.compile(
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net"
+    r"|googlesyndication\.com|googleadservices\.com"
+)
+
 
 # ---------------------------------------------------------------------------
 # Adaptive concurrency manager
 # ---------------------------------------------------------------------------
 
+class BucketedSWA:
+    """Sliding window of (concurrency, throughput) samples, bucketed by level.
+
+    Keeps a running sum and count per concurrency level, so a push is O(1)
+    and finding the best level only scans the levels, not the window.
+    """
+
+    def __init__(self, levels: int, size: int = 30):
+        self.window: deque[tuple[int, float]] = deque(maxlen=size)
+        self._sum = [0.0] * levels
+        self._cnt = [0] * levels
+
+    def __len__(self) -> int:
+        return len(self.window)
+
+    def push(self, concurrency: int, throughput: float):
+        if len(self.window) == self.window.maxlen:
+            old_c, old_t = self.window[0]
+            self._sum[old_c] -= old_t
+            self._cnt[old_c] -= 1
+        self.window.append((concurrency, throughput))
+        self._sum[concurrency] += throughput
+        self._cnt[concurrency] += 1
+
+    def argmax(self, lo: int, hi: int) -> int:
+        """Level in [lo, hi] with the highest average throughput."""
+        return max(
+            range(lo, hi + 1),
+            key=lambda c: self._sum[c] / self._cnt[c] if self._cnt[c] else -1.0,
+        )
+
+
 class ConcurrencyManager:
     """Adjusts target concurrency based on a rolling throughput history."""
 
@@ -83,68 +177,79 @@ class ConcurrencyManager:
         self._success_count = 0
         self._error_count = 0
         self._last_check_time = time.monotonic()
-        self._lock = asyncio.Lock()
-        self.throughput_history: deque[tuple[int, float]] = deque(maxlen=30)
+        # Set by record_error on an error burst so the adjuster can react
+        # before its regular interval elapses
+        self.wake = asyncio.Event()
+        self.throughput_history = BucketedSWA(max(initial, max_val) + 1)
 
-    async def record_success(self):
-        async with self._lock:
-            self._success_count += 1
+    # The counters are only touched from the event loop thread and never
+    # across an await, so plain increments are already atomic.
+    def record_success(self):
+        self._success_count += 1
 
-    async def record_error(self):
-        async with self._lock:
-            self._error_count += 1
+    def record_error(self):
+        self._error_count += 1
+        if self._error_count >= ERROR_BURST:
+            self.wake.set()
 
     async def adjust_concurrency(self):
-        async with self._lock:
-            elapsed = time.monotonic() - self._last_check_time
-            if elapsed < 20:
-                return
-
-            total = self._success_count + self._error_count
-            if total == 0:
+        burst = self.wake.is_set()
+        self.wake.clear()
+        elapsed = time.monotonic() - self._last_check_time
+        if elapsed < ADJUST_INTERVAL:
+            # An error burst may only lower concurrency early; its short
+            # window is not a throughput sample comparable to the others,
+            # so the counters keep accumulating towards the next full one.
+            if burst and self._error_rate() > 0.1:
                 self._reset_counters()
-                return
+                self._lower_concurrency()
+            return
+        successes, errors = self._success_count, self._error_count
+        self._reset_counters()
 
-            error_rate = self._error_count / total
-            throughput = self._success_count / elapsed
+        total = successes + errors
+        if total == 0:
+            return
 
-            logger.info(
-                "[ADJUSTER] target=%d throughput=%.2f url/s error_rate=%.2f%%",
-                self.target_concurrency, throughput, error_rate * 100,
-            )
+        error_rate = errors / total
+        throughput = successes / elapsed
 
-            if error_rate > 0.1:
-                new = max(self.min, int(self.target_concurrency * 0.7))
-                if new != self.target_concurrency:
-                    logger.warning("🚨 High error rate — lowering concurrency to %d", new)
-                    self.target_concurrency = new
-                self._reset_counters()
-                return
+        logger.info(
+            "[ADJUSTER] target=%d throughput=%.2f url/s error_rate=%.2f%%",
+            self.target_concurrency, throughput, error_rate * 100,
+        )
 
-            self.throughput_history.append((self.target_concurrency, throughput))
+        if error_rate > 0.1:
+            self._lower_concurrency()
+            return
 
-            if len(self.throughput_history) < 5:
-                self.target_concurrency = min(self.max, self.target_concurrency + 1)
-                self._reset_counters()
-                return
-
-            perf: dict[int, list[float]] = {}
-            for c, t in self.throughput_history:
-                perf.setdefault(c, []).append(t)
-            avg_perf = {c: sum(ts) / len(ts) for c, ts in perf.items()}
-            best = max(avg_perf, key=avg_perf.get)  # type: ignore[arg-type]
-
-            if self.target_concurrency < best:
-                self.target_concurrency = min(self.max, self.target_concurrency + 1)
-                logger.info("📈 Towards optimum (%d) → %d", best, self.target_concurrency)
-            elif self.target_concurrency > best:
-                self.target_concurrency = max(self.min, self.target_concurrency - 1)
-                logger.info("📉 Passed optimum (%d) → %d", best, self.target_concurrency)
-            else:
-                self.target_concurrency = min(self.max, self.target_concurrency + 1)
-                logger.info("✅ At optimum, probing higher → %d", self.target_concurrency)
+        self.throughput_history.push(self.target_concurrency, throughput)
+
+        if len(self.throughput_history) < 5:
+            self.target_concurrency = min(self.max, self.target_concurrency + 1)
+            return
+
+        best = self.throughput_history.argmax(self.min, self.max)
 
-            self._reset_counters()
+        if self.target_concurrency < best:
+            self.target_concurrency = min(self.max, self.target_concurrency + 1)
+            logger.info("📈 Towards optimum (%d) → %d", best, self.target_concurrency)
+        elif self.target_concurrency > best:
+            self.target_concurrency = max(self.min, self.target_concurrency - 1)
+            logger.info("📉 Passed optimum (%d) → %d", best, self.target_concurrency)
+        else:
+            self.target_concurrency = min(self.max, self.target_concurrency + 1)
+            logger.info("✅ At optimum, probing higher → %d", self.target_concurrency)
+
+    def _error_rate(self) -> float:
+        total = self._success_count + self._error_count
+        return self._error_count / total if total else 0.0
+
+    def _lower_concurrency(self):
+        new = max(self.min, int(self.target_concurrency * 0.7))
+        if new != self.target_concurrency:
+            logger.warning("🚨 High error rate — lowering concurrency to %d", new)
+            self.target_concurrency = new
 
     def _reset_counters(self):
         self._success_count = 0
@@ -152,32 +257,174 @@ class ConcurrencyManager:
         self._last_check_time = time.monotonic()
 
 
+# ---------------------------------------------------------------------------
+# Request rate limiter
+# ---------------------------------------------------------------------------
+
+class RateLimiter:
+    """Token bucket shared by all URL tasks.
+
+    Allows *rate* page loads per second across every task, with bursts of up
+    to *burst*. Tasks only wait when they are over budget, and waiters are
+    served in arrival order. *clock* and *sleep* can be replaced for tests.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError(f"Invalid rate: {rate!r} (must be positive)")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await self._sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Page pool
+# ---------------------------------------------------------------------------
+
+class PagePool:
+    """Reuses open pages across URLs instead of opening one per URL.
+
+    Pages are created on demand and each worker holds at most one, so the
+    pool never holds more pages than there are workers (*max_concurrency*).
+    A page is closed instead of reused after
+    *max_uses* navigations, or when its task failed and it may be stuck.
+    """
+
+    def __init__(self, context, max_uses: int = 50):
+        self.context = context
+        self.max_uses = max_uses
+        self._idle: list = []
+        self._uses: dict = {}
+
+    async def acquire(self):
+        while self._idle:
+            page = self._idle.pop()
+            if not page.is_closed():
+                return page
+            self._uses.pop(page, None)
+        page = await self.context.new_page()
+        self._uses[page] = 0
+        return page
+
+    async def release(self, page, reuse: bool = True):
+        self._uses[page] = self._uses.get(page, 0) + 1
+        if reuse and self._uses[page] < self.max_uses and not page.is_closed():
+            self._idle.append(page)
+            return
+        self._uses.pop(page, None)
+        try:
+            await page.close()
+        except Exception as exc:
+            logger.debug("Failed to close pooled page: %s", exc)
+
+    async def close(self):
+        while self._idle:
+            await self.release(self._idle.pop(), reuse=False)
+
+
 # ---------------------------------------------------------------------------
 # Page-level helpers
 # ---------------------------------------------------------------------------
 
 async def _adjuster_task(manager: ConcurrencyManager, shutdown_event: asyncio.Event):
     while not shutdown_event.is_set():
-        await asyncio.sleep(5)
-        await manager.adjust_concurrency()
+        try:
+            await asyncio.wait_for(manager.wake.wait(), timeout=ADJUST_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        # A failed adjustment must not end the task, or concurrency would
+        # stay frozen for the rest of the run
+        try:
+            await manager.adjust_concurrency()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("[ADJUSTER] Adjustment failed")
 
 
 def _get_car_id(url: str) -> str | None:
-    try:
-        return parse_qs(urlparse(url).query).get("c", [None])[0]
-    except Exception:
-        return None
+    match = _CAR_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
-async def _block_unnecessary(page):
-    await page.route(
-        "**/*",
-        lambda route: (
-            route.abort()
-            if route.request.resource_type in ["image", "stylesheet", "font", "media"]
-            else route.continue_()
-        ),
-    )
+def _route_request(route):
+    request = route.request
+    if (
+        request.resource_type in _BLOCKED_RESOURCE_TYPES
+        or _BLOCKED_HOSTS_RE.search(request.url)
+    ):
+        return route.abort()
+    return route.continue_()
+
+
+def _pending_with_ids(urls: list[str], done_ids: set[str]) -> list[tuple[str, str]]:
+    """Pair each URL with its car ID, rejecting invalid ones before any page opens.
+
+    URLs whose ID is in *done_ids* or repeats an earlier URL are dropped, so
+    each car is scraped once per run. *done_ids* is extended in place with
+    the IDs that were kept; pass an empty set when nothing is done yet.
+    """
+    pending: list[tuple[str, str]] = []
+    for url in urls:
+        car_id = _get_car_id(url)
+        if not car_id:
+            logger.error("Invalid car ID for URL %s — skipping.", url)
+            continue
+        if car_id in done_ids:
+            continue
+        done_ids.add(car_id)
+        pending.append((url, car_id))
+    return pending
+
+
+async def _new_context(browser):
+    """Open the scraping context, restoring the previous run's cookies if any."""
+    if os.path.exists(STORAGE_STATE_FILE):
+        try:
+            return await browser.new_context(
+                user_agent=USER_AGENT, storage_state=STORAGE_STATE_FILE
+            )
+        except Exception as exc:
+            logger.warning("Ignoring unreadable '%s': %s", STORAGE_STATE_FILE, exc)
+    return await browser.new_context(user_agent=USER_AGENT)
+
+
+def _scraped_car_ids() -> set[str]:
+    """IDs that already have a JSON file in OUTPUT_DIR, from one directory read."""
+    with os.scandir(OUTPUT_DIR) as entries:
+        return {e.name[:-5] for e in entries if e.name.endswith(".json")}
+
+
+async def _block_unnecessary(context):
+    """Abort heavy and tracking requests for every page opened in *context*."""
+    await context.route("**/*", _route_request)
 
 
 async def handle_consent(p):
@@ -217,65 +464,67 @@ async def _scrape_detail_page(page) -> dict:
     try:
         title_el = page.locator("div.header-text h1").first
         full_title = (await title_el.inner_text()).strip()
-        parts = full_title.split()
-        if parts and parts[-1].isdigit() and len(parts[-1]) == 4:
+        # innerText can keep newlines (<br>, block children) and non-breaking
+        # spaces: split the last token off on any whitespace, then collapse
+        # the whitespace runs left in the rest of the title
+        remaining = full_title
+        parts = full_title.rsplit(None, 1)
+        if parts and len(parts[-1]) == 4 and parts[-1].isdigit():
             data["año"] = int(parts.pop())
-        remaining = " ".join(parts)
-        for marca in MARCAS:
-            if remaining.upper().startswith(marca):
-                data["marca"] = marca
-                data["modelo"] = remaining[len(marca):].strip()
-                break
-        if "modelo" not in data:
+            remaining = parts[0] if parts else ""
+        remaining = _WS_RE.sub(" ", remaining)
+        match = _MARCA_RE.match(remaining)
+        if match:
+            data["marca"] = match.group(1).upper()
+            data["modelo"] = remaining[match.end():].strip()
+        else:
             data["modelo"] = remaining
     except Exception as e:
         logger.debug("Failed to extract title/year/make for %s: %s", page.url, e)
 
     try:
         price_usd_text = await page.locator("div.header-text h1").nth(1).inner_text()
-        data["precio_crc"] = float(re.sub(r"[^\d.]", "", price_usd_text))
+        data["precio_crc"] = float(_NON_DECIMAL_RE.sub("", price_usd_text))
     except Exception as e:
         logger.debug("Failed to extract precio_crc for %s: %s", page.url, e)
 
     try:
         price_crc_text = await page.locator("div.header-text h3").first.inner_text()
-        data["precio_usd"] = int(re.sub(r"[^\d]", "", price_crc_text))
+        data["precio_usd"] = int(_NON_DIGITS_RE.sub("", price_crc_text))
     except Exception as e:
         logger.debug("Failed to extract precio_usd for %s: %s", page.url, e)
 
     try:
         data["imagen_principal"] = await page.locator("div.bannerimg").get_attribute("data-image-src")
-        data["galeria_imagenes"] = [
-            await img.get_attribute("src")
-            for img in await page.locator("div.ws_images ul li img").all()
-        ]
+        data["galeria_imagenes"] = await page.locator("div.ws_images ul li img").evaluate_all(
+            _GALLERY_JS
+        )
     except Exception as e:
         logger.debug("Failed to extract images for %s: %s", page.url, e)
 
     try:
         seller_info: dict = {}
-        seller_table = page.locator('//table[.//td[contains(., "Vendedor")]]')
-        for row in await seller_table.locator("tr").all():
-            cells = await row.locator("td").all()
+        rows = await page.locator(_SELLER_TABLE_SELECTOR).evaluate_all(_SELLER_ROWS_JS)
+        for cells in rows:
             if len(cells) == 2:
-                k = (await cells[0].inner_text()).strip().lower().replace(":", "")
-                v = (await cells[1].inner_text()).strip()
+                k = cells[0].strip().lower().replace(":", "")
+                v = cells[1].strip()
                 if k and v:
-                    seller_info[k] = re.sub(r"\s+", " ", v)
+                    seller_info[k] = _WS_RE.sub(" ", v)
         data["vendedor"] = seller_info
     except Exception as e:
         logger.debug("Failed to extract seller info for %s: %s", page.url, e)
 
     try:
         general: dict = {}
-        for row in await page.locator("table.mytext2 tbody tr").all():
-            cells = await row.locator("td").all()
+        rows = await page.locator("table.mytext2 tbody tr").evaluate_all(_GENERAL_ROWS_JS)
+        for cells in rows:
             if len(cells) == 2:
-                k = (await cells[0].inner_text()).strip().lower().replace(" ", "_")
-                v = (await cells[1].inner_text()).strip()
-                general[k] = re.sub(r"\s+", " ", v)
-            elif len(cells) == 1 and await cells[0].get_attribute("bgcolor") == "#FAF7B4":
-                general["comentario_vendedor"] = (await cells[0].inner_text()).strip()
+                k = cells[0][0].strip().lower().replace(" ", "_")
+                v = cells[1][0].strip()
+                general[k] = _WS_RE.sub(" ", v)
+            elif len(cells) == 1 and cells[0][1] == "#FAF7B4":
+                general["comentario_vendedor"] = cells[0][0].strip()
         data["informacion_general"] = general
     except Exception as e:
         logger.debug("Failed to extract general info for %s: %s", page.url, e)
@@ -283,19 +532,14 @@ async def _scrape_detail_page(page) -> dict:
     for field, dest in [("kilometraje", "kilometraje_number"), ("cilindrada", "cilindrada_number")]:
         if field in data.get("informacion_general", {}):
             try:
-                val = re.sub(r"[^\d]", "", data["informacion_general"][field])
+                val = _NON_DIGITS_RE.sub("", data["informacion_general"][field])
                 data["informacion_general"][dest] = int(val) if val else None
             except ValueError as e:
                 logger.debug("Failed to parse numeric %s for %s: %s", field, page.url, e)
 
     try:
-        equip: list[str] = []
-        tables = page.locator('//table[@class="table table-bordered border-top table-striped"]')
-        for row in await tables.locator("tbody tr").all():
-            cells = await row.locator("td").all()
-            if len(cells) == 2 and await cells[1].locator("i.icon-check").count() > 0:
-                equip.append((await cells[0].inner_text()).strip())
-        data["equipamiento"] = sorted(equip)
+        equip = await page.locator(_EQUIPMENT_TABLE_SELECTOR).evaluate_all(_EQUIPMENT_JS)
+        data["equipamiento"] = sorted(name.strip() for name in equip)
     except Exception as e:
         logger.debug("Failed to extract equipment for %s: %s", page.url, e)
 
@@ -308,8 +552,9 @@ async def _scrape_detail_page(page) -> dict:
 
 async def _scrape_single_url(
     url: str,
-    context,
-    semaphore: asyncio.Semaphore,
+    car_id: str,
+    pool: PagePool,
+    limiter: RateLimiter,
     manager: ConcurrencyManager,
     repository=None,
     shutdown_event: asyncio.Event | None = None,
@@ -317,72 +562,61 @@ async def _scrape_single_url(
     if shutdown_event and shutdown_event.is_set():
         return
 
-    async with semaphore:
-        car_id = _get_car_id(url)
-        if not car_id:
-            logger.error("Invalid car ID for URL %s — skipping.", url)
-            await manager.record_error()
-            return
-
-        # Standalone mode: skip already-processed files
-        if repository is None:
-            out_path = os.path.join(OUTPUT_DIR, f"{car_id}.json")
-            if os.path.exists(out_path):
-                return
+    page = None
+    for attempt in range(TRIES):
+        if shutdown_event and shutdown_event.is_set():
+            break
+        reuse_page = False
+        try:
+            page = await pool.acquire()
+            logger.info("Scraping ID %s (attempt %d/%d)", car_id, attempt + 1, TRIES)
 
-        page = None
-        for attempt in range(TRIES):
-            if shutdown_event and shutdown_event.is_set():
-                break
-            try:
-                page = await context.new_page()
-                await _block_unnecessary(page)
-                logger.info("Scraping ID %s (attempt %d/%d)", car_id, attempt + 1, TRIES)
-                
+            async with limiter:
                 response = await page.goto(url, wait_until="domcontentloaded", timeout=45000)
-                if response and response.status >= 400:
-                    logger.warning("Network warning: URL %s returned status %s", url, response.status)
-
-                # Handle possible consent overlay
-                await handle_consent(page)
-
-                car_data = await _scrape_detail_page(page)
+            if response and response.status >= 400:
+                logger.warning("Network warning: URL %s returned status %s", url, response.status)
+
+            # Handle possible consent overlay
+            await handle_consent(page)
+
+            car_data = await _scrape_detail_page(page)
+
+            # Persist from a worker thread so the event loop keeps driving
+            # the other pages while the row (or file) is written
+            if repository is not None:
+                try:
+                    await asyncio.to_thread(repository.mark_url_done, url, car_id, car_data)
+                except Exception as db_exc:
+                    logger.error("❌ DB Error marking ID %s as done: %s", car_id, db_exc)
+                    raise  # Re-raise to trigger retry
+            else:
+                await asyncio.to_thread(
+                    save_json, car_data, os.path.join(OUTPUT_DIR, f"{car_id}.json")
+                )
 
+            logger.info("✅ ID %s saved.", car_id)
+            reuse_page = True
+            manager.record_success()
+            return
+        except Exception as exc:
+            logger.warning("⚠️ Attempt %d failed for ID %s: [%s] %s", attempt + 1, car_id, type(exc).__name__, exc)
+            if attempt == TRIES - 1:
+                logger.error("❌ Giving up on ID %s after %d attempts.", car_id, TRIES)
                 if repository is not None:
                     try:
-                        repository.mark_url_done(url, car_id, car_data)
+                        await asyncio.to_thread(repository.mark_url_failed, url)
                     except Exception as db_exc:
-                        logger.error("❌ DB Error marking ID %s as done: %s", car_id, db_exc)
-                        raise  # Re-raise to trigger retry
-                else:
-                    os.makedirs(OUTPUT_DIR, exist_ok=True)
-                    with open(os.path.join(OUTPUT_DIR, f"{car_id}.json"), "w", encoding="utf-8") as f:
-                        json.dump(car_data, f, ensure_ascii=False, indent=4)
-
-                logger.info("✅ ID %s saved.", car_id)
-                await manager.record_success()
-                await asyncio.sleep(random.uniform(1, 4))
-                return
-            except Exception as exc:
-                logger.warning("⚠️ Attempt %d failed for ID %s: [%s] %s", attempt + 1, car_id, type(exc).__name__, exc)
-                if attempt == TRIES - 1:
-                    logger.error("❌ Giving up on ID %s after %d attempts.", car_id, TRIES)
-                    if repository is not None:
-                        try:
-                            repository.mark_url_failed(url)
-                        except Exception as db_exc:
-                            logger.error("❌ DB Error marking ID %s as failed: %s", car_id, db_exc)
-                    await manager.record_error()
-                else:
-                    await asyncio.sleep(3 + attempt * 2)
-            finally:
-                if page:
-                    try:
-                        await page.close()
-                    except Exception as close_exc:
-                        logger.debug("Failed to close page for ID %s: %s", car_id, close_exc)
-                    finally:
-                        page = None
+                        logger.error("❌ DB Error marking ID %s as failed: %s", car_id, db_exc)
+                manager.record_error()
+            else:
+                # Exponential back-off with jitter so retries do not line up
+                await asyncio.sleep(3 * 2 ** attempt + random.random())
+        finally:
+            if page:
+                # A failed attempt may leave the page mid-navigation:
+                # close it rather than hand it to the next URL
+                await pool.release(page, reuse=reuse_page)
+                page = None
 
 
 # ---------------------------------------------------------------------------
@@ -395,6 +629,7 @@ async def main(
     initial_concurrency: int = 3,
     min_concurrency: int = 1,
     max_concurrency: int = 10,
+    requests_per_second: float = 2.0,
     shutdown_event: asyncio.Event | None = None,
     # standalone-mode args
     urls_file: str = "urls.json",
@@ -409,6 +644,9 @@ async def main(
     repository   : ScraperRepository | None
         SQLite repo. When None, falls back to JSON file I/O.
     headless     : bool   — headless Chromium
+    requests_per_second : float
+        Ceiling on page loads per second across all concurrent tasks; must
+        be positive (ValueError otherwise).
     shutdown_event : asyncio.Event | None
         Signals graceful stop (set by SIGINT/SIGTERM in run_scraper).
     urls_file    : str
@@ -419,22 +657,18 @@ async def main(
 
     # Collect URLs to process
     if repository is not None:
-        urls_to_process = repository.get_pending_urls(limit=99_999)
+        urls_to_process = _pending_with_ids(repository.get_pending_urls(limit=99_999), set())
         logger.info("Loaded %d pending URLs from DB.", len(urls_to_process))
     else:
         # Standalone: load from json file, skip already-done
         if not os.path.exists(urls_file):
             logger.error("URL file '%s' not found.", urls_file)
             return "failed"
-        with open(urls_file, "r", encoding="utf-8") as f:
-            all_urls: list[str] = json.load(f)
+        all_urls: list[str] = load_json(urls_file)
         os.makedirs(OUTPUT_DIR, exist_ok=True)
-        urls_to_process = [
-            u for u in all_urls
-            if not os.path.exists(os.path.join(OUTPUT_DIR, f"{_get_car_id(u)}.json"))
-        ]
+        urls_to_process = _pending_with_ids(all_urls, _scraped_car_ids())
         logger.info(
-            "Loaded %d URLs; %d already scraped; %d remaining.",
+            "Loaded %d URLs; %d already scraped, repeated or invalid; %d remaining.",
             len(all_urls), len(all_urls) - len(urls_to_process), len(urls_to_process),
         )
 
@@ -442,35 +676,54 @@ async def main(
         logger.info("🎉 Nothing to scrape — all URLs are done.")
         return "done"
 
+    # Built before the browser starts, so an invalid rate fails the run at once
+    limiter = RateLimiter(requests_per_second)
     manager = ConcurrencyManager(initial_concurrency, min_concurrency, max_concurrency)
     start_time = time.monotonic()
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
-        context = await browser.new_context(user_agent=USER_AGENT)
+        browser = await p.chromium.launch(headless=headless, args=_LAUNCH_ARGS)
+        context = await _new_context(browser)
+        await _block_unnecessary(context)
         adjuster = asyncio.create_task(_adjuster_task(manager, shutdown_event))
-        semaphore = asyncio.Semaphore(max_concurrency)
+        pool = PagePool(context)
 
-        tasks = [
-            _scrape_single_url(url, context, semaphore, manager, repository, shutdown_event)
-            for url in urls_to_process
-        ]
+        # A fixed set of workers drains the queue, so only max_concurrency
+        # URLs are in flight and no coroutine exists per pending URL.
+        url_queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+        for item in urls_to_process:
+            url_queue.put_nowait(item)
 
         completed = 0
-        for fut in asyncio.as_completed(tasks):
-            await fut
-            completed += 1
-            if completed % 10 == 0 or completed == len(urls_to_process):
-                _log_eta(completed, len(urls_to_process), start_time)
-            if shutdown_event.is_set():
-                logger.info("Shutdown requested — stopping remaining tasks.")
-                break
+
+        async def worker():
+            nonlocal completed
+            while not shutdown_event.is_set():
+                try:
+                    url, car_id = url_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await _scrape_single_url(
+                    url, car_id, pool, limiter, manager, repository, shutdown_event
+                )
+                completed += 1
+                if completed % 10 == 0 or completed == len(urls_to_process):
+                    _log_eta(completed, len(urls_to_process), start_time)
+
+        await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+        if shutdown_event.is_set():
+            logger.info("Shutdown requested — stopping remaining tasks.")
 
         adjuster.cancel()
         try:
             await adjuster
         except asyncio.CancelledError:
             pass
+        await pool.close()
+        try:
+            await context.storage_state(path=STORAGE_STATE_FILE)
+        except Exception as exc:
+            logger.debug("Failed to save storage state: %s", exc)
         await browser.close()
 
     if shutdown_event.is_set():
@@ -491,6 +744,7 @@ if __name__ == "__main__":
     parser.add_argument("--initial", type=int, default=3)
     parser.add_argument("--min", type=int, default=1)
     parser.add_argument("--max", type=int, default=30)
+    parser.add_argument("--rps", type=float, default=2.0, help="Max page loads per second.")
     parser.add_argument("--headless", action="store_true", default=False)
     args = parser.parse_args()
 
@@ -501,5 +755,6 @@ if __name__ == "__main__":
             initial_concurrency=args.initial,
             min_concurrency=args.min,
             max_concurrency=args.max,
+            requests_per_second=args.rps,
         )
     )
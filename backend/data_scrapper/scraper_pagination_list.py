@@ -26,7 +26,7 @@ import logging
 import os
 import time
 from datetime import datetime, timedelta
-from urllib.parse import urljoin
+from pathlib import Path
 
 from playwright.async_api import (
     async_playwright,
@@ -39,38 +39,126 @@ try:
 except ImportError:
     ScraperRepository = None  # type: ignore[assignment,misc]
 
+# Works both inside the package and when run as a script from this folder
+try:
+    from data_scrapper.json_io import load_json, save_json
+except ImportError:
+    from json_io import load_json, save_json
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
 # --- File-based fallback paths (standalone mode) ---
+# Resolved once at import, so a run that crosses midnight keeps writing to
+# the directory it started in.
 today = datetime.now().strftime("%d_%m_%Y")
-_DATA_DIR = f"data_scrapper/data/{today}"
-URLS_FILE = f"{_DATA_DIR}/urls.json"
-FAILED_URLS_FILE = f"{_DATA_DIR}/failed_urls.json"
+_DATA_DIR = Path("data_scrapper/data") / today
+URLS_FILE = _DATA_DIR / "urls.json"
+# Append-only log of URLs found so far; turned into URLS_FILE when done
+URLS_PARTIAL_FILE = _DATA_DIR / "urls.ndjson"
+# Append-only log (JSON Lines) of pages that failed; deduplicated on read
+FAILED_URLS_FILE = _DATA_DIR / "failed_urls.jsonl"
+
+# Only anchor hrefs are read from listing pages; these are never needed.
+# Scripts stay allowed: pagination runs through the site's p('<n>') postback.
+_BLOCKED_RESOURCE_TYPES = frozenset(
+    {"image", "font", "stylesheet", "media", "texttrack", "manifest"}
+)
+
+# Shared by the collection and retry passes
+_DETAIL_LINK_SELECTOR = 'a[href^="cardetail.cfm"]'
+# Every detail link on a page, deduplicated in the browser; e.href is absolute
+_DETAIL_HREFS_JS = "els => [...new Set(els.map(e => e.href))]"
+# Page number inside the "Última Página" javascript:p('<n>') href
+_LAST_PAGE_RE = re.compile(r"p\('(\d+)'\)")
+# Car ID: the non-empty "c" query parameter of a cardetail.cfm URL
+_CAR_ID_RE = re.compile(r"[?&]c=([^&#]+)")
+
+# Nothing is rendered for a human: skip the GPU process and avoid the small
+# /dev/shm of containers
+_LAUNCH_ARGS = ["--disable-gpu", "--disable-dev-shm-usage"]
 
 
 # ---------------------------------------------------------------------------
 # File-based helpers (standalone / backward-compat)
 # ---------------------------------------------------------------------------
 
-def _save_json(data, filename):
+def _read_jsonl(filename) -> list:
+    """Read a JSON Lines file, skipping a line truncated by a crash."""
+    if not Path(filename).exists():
+        return []
+    items = []
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError:
+                pass
+    return items
+
+
+def _write_jsonl(items, filename):
     with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+        f.writelines(json.dumps(item) + "\n" for item in items)
+
+
+# Failed items already in FAILED_URLS_FILE; loaded lazily on first append
+_failed_seen: set[str] | None = None
 
 
 def _append_failed_url(url):
-    failed_urls = []
-    if os.path.exists(FAILED_URLS_FILE):
-        with open(FAILED_URLS_FILE, "r", encoding="utf-8") as f:
-            try:
-                failed_urls = json.load(f)
-            except json.JSONDecodeError:
-                failed_urls = []
-    if url not in failed_urls:
-        failed_urls.append(url)
-    _save_json(failed_urls, FAILED_URLS_FILE)
+    global _failed_seen
+    if _failed_seen is None:
+        _failed_seen = set(_read_jsonl(FAILED_URLS_FILE))
+    if url in _failed_seen:
+        return
+    _failed_seen.add(url)
+    with FAILED_URLS_FILE.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(url) + "\n")
+
+
+def _get_car_id(url: str) -> str | None:
+    match = _CAR_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _by_car_id(urls, known: dict[str, str] | None = None) -> dict[str, str]:
+    """Map car ID -> URL for *urls*, keeping the first URL seen for each ID.
+
+    Listing links for one car can differ in their other query parameters;
+    IDs already in *known* are left out. URLs without a car ID are dropped
+    and counted in a warning, since that means the link format changed.
+    """
+    found: dict[str, str] = {}
+    missing = 0
+    for url in urls:
+        car_id = _get_car_id(url)
+        if not car_id:
+            missing += 1
+        elif car_id not in found and (known is None or car_id not in known):
+            found[car_id] = url
+    if missing:
+        logger.warning("Dropped %d URL(s) without a car ID (c=...) parameter.", missing)
+    return found
+
+
+def _load_partial_urls() -> dict[str, str]:
+    """Read the URLs logged by an interrupted standalone run, if any."""
+    return _by_car_id(_read_jsonl(URLS_PARTIAL_FILE))
+
+
+async def _block_unnecessary(context):
+    """Abort heavy resource requests for every page opened in *context*."""
+    await context.route(
+        "**/*",
+        lambda route: (
+            route.abort()
+            if route.request.resource_type in _BLOCKED_RESOURCE_TYPES
+            else route.continue_()
+        ),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -108,7 +196,8 @@ async def _collect_all_urls(
 
     # --- Determine resume state ---
     start_page = 1
-    detail_urls: set[str] = set()
+    # car ID -> detail URL, so each car is listed once
+    detail_urls: dict[str, str] = {}
     known_total_pages: int | None = None
 
     if repository is not None:
@@ -116,10 +205,17 @@ async def _collect_all_urls(
         # Checkpoints are intentionally ignored here to conform to the new requirement.
         # We start from page 1 and collect all URLs from scratch.
         pass
-    elif os.path.exists(URLS_FILE):
+    elif URLS_FILE.exists():
         # Standalone fallback: already done
         logger.info("'%s' exists — skipping URL collection.", URLS_FILE)
         return "done"
+    else:
+        detail_urls = _load_partial_urls()
+        if detail_urls:
+            logger.info(
+                "Loaded %d URLs from '%s' (previous run).",
+                len(detail_urls), URLS_PARTIAL_FILE,
+            )
 
     logger.info("Initializing pool of %d worker tabs...", concurrency)
     worker_pages = []
@@ -159,7 +255,7 @@ async def _collect_all_urls(
             await handle_consent(p)
 
             await p.locator(".btn.btn-lg.btn-success").click(timeout=30000)
-            await p.wait_for_selector('a[href^="cardetail.cfm"]', timeout=30000)
+            await p.wait_for_selector(_DETAIL_LINK_SELECTOR, timeout=30000)
             return p
         except Exception as exc:
             logger.error("Error initializing worker tab: %s", exc)
@@ -183,7 +279,7 @@ async def _collect_all_urls(
         try:
             last_page_link = base_page.locator('a:has-text("Última Página")')
             href = await last_page_link.get_attribute("href", timeout=5000)
-            match = re.search(r"p\('(\d+)'\)", href)
+            match = _LAST_PAGE_RE.search(href)
             if not match:
                 logger.error("Could not determine last page number. Aborting.")
                 return "failed"
@@ -198,85 +294,39 @@ async def _collect_all_urls(
 
     last_page_number = known_total_pages
 
-    # --- Page Batch Loop ---
-    start_time = time.time()
-    for batch_start in range(start_page, last_page_number + 1, actual_concurrency):
-        if shutdown_event.is_set():
-            logger.info(
-                "Shutdown requested at batch %d — saving progress and pausing.",
-                batch_start,
-            )
-            if repository is not None and run_id is not None:
-                repository.save_pagination_progress(
-                    run_id, batch_start - 1, last_page_number, list(detail_urls)
-                )
-            for p in worker_pages:
-                try:
-                    if p:
-                        await p.close()
-                except:
-                    pass
-            return "paused"
-
-        batch_end = min(batch_start + actual_concurrency - 1, last_page_number)
-        batch_pages = list(range(batch_start, batch_end + 1))
-
-        logger.info("Processing batch of pages %s to %s (out of %d)...", batch_start, batch_end, last_page_number)
-
-        async def scrape_single_page(worker_index: int, page_num: int):
-            max_retries = 5
-            for attempt in range(max_retries):
-                wp = worker_pages[worker_index]
-                
-                # If worker page is broken/closed, attempt to re-initialize it
-                if wp is None or wp.is_closed():
-                    if attempt > 0:
-                        logger.info("Re-initializing worker %d for page %d (attempt %d/%d)...", worker_index, page_num, attempt + 1, max_retries)
-                    wp = await init_worker_tab()
-                    worker_pages[worker_index] = wp
-                    if not wp:
-                        if attempt == max_retries - 1:
-                            return page_num, False, 0
-                        await asyncio.sleep(2)
-                        continue
-                    
-                page_new_count = 0
-
-                # It's possible the context doesn't have `p` if it navigated away or threw an error earlier.
-                if page_num > 1:
-                    try:
-                        await wp.wait_for_function("typeof p === 'function'", timeout=15000)
-                        async with wp.expect_navigation(wait_until="domcontentloaded", timeout=45000):
-                            await wp.evaluate(f"p('{page_num}')")
-                    except Exception as exc:
-                        logger.warning("Failed to navigate to page %d on attempt %d/%d: %s", page_num, attempt + 1, max_retries, exc)
-                        # Close page so it's re-initialized next time
-                        try:
-                            await wp.close()
-                        except:
-                            pass
-                        worker_pages[worker_index] = None
-                        if attempt == max_retries - 1:
-                            return page_num, False, 0
-                        continue
-
-                try:
-                    await wp.wait_for_selector('a[href^="cardetail.cfm"]', timeout=30000)
-                    links = await wp.locator('a[href^="cardetail.cfm"]').all()
-                    for link in links:
-                        href = await link.get_attribute("href")
-                        if href:
-                            absolute_url = urljoin(wp.url, href)
-                            if absolute_url not in detail_urls:
-                                detail_urls.add(absolute_url)
-                                page_new_count += 1
-                    return page_num, True, page_new_count
-                except PlaywrightTimeoutError:
-                    logger.warning("No links found on page %d (attempt %d/%d).", page_num, attempt + 1, max_retries)
+    # --- Page Queue ---
+    # Every worker tab pulls the next pending page as soon as it finishes the
+    # previous one, so one slow page no longer holds back the whole batch.
+    page_queue: asyncio.Queue[int] = asyncio.Queue()
+    for page_num in range(start_page, last_page_number + 1):
+        page_queue.put_nowait(page_num)
+
+    async def scrape_single_page(worker_index: int, page_num: int):
+        max_retries = 5
+        for attempt in range(max_retries):
+            wp = worker_pages[worker_index]
+            
+            # If worker page is broken/closed, attempt to re-initialize it
+            if wp is None or wp.is_closed():
+                if attempt > 0:
+                    logger.info("Re-initializing worker %d for page %d (attempt %d/%d)...", worker_index, page_num, attempt + 1, max_retries)
+                wp = await init_worker_tab()
+                worker_pages[worker_index] = wp
+                if not wp:
                     if attempt == max_retries - 1:
                         return page_num, False, 0
+                    await asyncio.sleep(2)
+                    continue
+                
+            # It's possible the context doesn't have `p` if it navigated away or threw an error earlier.
+            if page_num > 1:
+                try:
+                    await wp.wait_for_function("typeof p === 'function'", timeout=15000)
+                    async with wp.expect_navigation(wait_until="domcontentloaded", timeout=45000):
+                        await wp.evaluate(f"p('{page_num}')")
                 except Exception as exc:
-                    logger.error("Error extracting links on page %d (attempt %d/%d): %s", page_num, attempt + 1, max_retries, exc)
+                    logger.warning("Failed to navigate to page %d on attempt %d/%d: %s", page_num, attempt + 1, max_retries, exc)
+                    # Close page so it's re-initialized next time
                     try:
                         await wp.close()
                     except:
@@ -284,18 +334,47 @@ async def _collect_all_urls(
                     worker_pages[worker_index] = None
                     if attempt == max_retries - 1:
                         return page_num, False, 0
+                    continue
+
+            try:
+                await wp.wait_for_selector(_DETAIL_LINK_SELECTOR, timeout=30000)
+                # One bridge call for every link on the page
+                hrefs = await wp.eval_on_selector_all(
+                    _DETAIL_LINK_SELECTOR, _DETAIL_HREFS_JS
+                )
+                new_urls = _by_car_id(hrefs, detail_urls)
+                detail_urls.update(new_urls)
+                if urls_log is not None:
+                    urls_log.writelines(json.dumps(u) + "\n" for u in new_urls.values())
+                return page_num, True, len(new_urls)
+            except PlaywrightTimeoutError:
+                logger.warning("No links found on page %d (attempt %d/%d).", page_num, attempt + 1, max_retries)
+                if attempt == max_retries - 1:
+                    return page_num, False, 0
+            except Exception as exc:
+                logger.error("Error extracting links on page %d (attempt %d/%d): %s", page_num, attempt + 1, max_retries, exc)
+                try:
+                    await wp.close()
+                except:
+                    pass
+                worker_pages[worker_index] = None
+                if attempt == max_retries - 1:
+                    return page_num, False, 0
 
-            return page_num, False, 0
+        return page_num, False, 0
 
-        # Run tasks concurrently
-        tasks = []
-        for i, p_num in enumerate(batch_pages):
-            tasks.append(scrape_single_page(i, p_num))
+    start_time = time.time()
+    pages_processed = 0
 
-        results = await asyncio.gather(*tasks)
+    async def worker(worker_index: int):
+        nonlocal pages_processed
+        while not shutdown_event.is_set():
+            try:
+                page_num = page_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
 
-        # Process results
-        for p_num, success, p_new in results:
+            p_num, success, p_new = await scrape_single_page(worker_index, page_num)
             if not success:
                 if repository is None:
                     _append_failed_url(f"PAGE::{p_num}")
@@ -304,21 +383,51 @@ async def _collect_all_urls(
             else:
                 logger.debug("Page %d: +%d URLs", p_num, p_new)
 
-        elapsed_time = time.time() - start_time
-        pages_processed = batch_end - start_page + 1
-        avg_speed = pages_processed / elapsed_time if elapsed_time > 0 else 0
-        pages_left = last_page_number - batch_end
-        eta_seconds = pages_left / avg_speed if avg_speed > 0 else 0
-        eta_str = str(timedelta(seconds=int(eta_seconds)))
+            pages_processed += 1
+            if pages_processed % actual_concurrency == 0:
+                elapsed_time = time.time() - start_time
+                avg_speed = pages_processed / elapsed_time if elapsed_time > 0 else 0
+                pages_left = page_queue.qsize()
+                eta_seconds = pages_left / avg_speed if avg_speed > 0 else 0
+                eta_str = str(timedelta(seconds=int(eta_seconds)))
+                logger.info(
+                    "%d/%d pages done. Total URLs so far: %d. ETA: %s (%.2f pages/sec)",
+                    pages_processed, last_page_number - start_page + 1,
+                    len(detail_urls), eta_str, avg_speed
+                )
 
+    # Standalone mode logs each page's new URLs as they are found, so a crash
+    # mid-run keeps everything discovered so far (block-buffered, no flush;
+    # the finally closes and flushes the log however the workers exit).
+    urls_log = None
+    if repository is None:
+        _DATA_DIR.mkdir(parents=True, exist_ok=True)
+        urls_log = URLS_PARTIAL_FILE.open("a", encoding="utf-8")
+    try:
+        await asyncio.gather(*(worker(i) for i in range(actual_concurrency)))
+    finally:
+        if urls_log is not None:
+            urls_log.close()
+
+    if shutdown_event.is_set() and not page_queue.empty():
+        # Workers finish their in-flight page before stopping, so every page
+        # below the lowest one still queued has been scraped.
+        next_page = min(page_queue.get_nowait() for _ in range(page_queue.qsize()))
         logger.info(
-            "Batch %s-%s done. Total URLs so far: %d. ETA: %s (%.2f pages/sec)",
-            batch_start, batch_end, len(detail_urls), eta_str, avg_speed
+            "Shutdown requested at page %d — saving progress and pausing.",
+            next_page,
         )
-
-        # We no longer save pagination progress mid-run by default as Step 1
-        # always restarts from the beginning.
-        pass
+        if repository is not None and run_id is not None:
+            repository.save_pagination_progress(
+                run_id, next_page - 1, last_page_number, list(detail_urls.values())
+            )
+        for p in worker_pages:
+            try:
+                if p:
+                    await p.close()
+            except:
+                pass
+        return "paused"
 
     # --- Cleanup workers ---
     for p in worker_pages:
@@ -328,7 +437,7 @@ async def _collect_all_urls(
             pass
 
     # --- All pages done ---
-    url_list = list(detail_urls)
+    url_list = list(detail_urls.values())
 
     if repository is not None:
         repository.upsert_urls(url_list)
@@ -336,89 +445,112 @@ async def _collect_all_urls(
             repository.clear_pagination_progress(run_id)
         logger.info("Seeded %d URLs into DB. Pagination checkpoint cleared.", len(url_list))
     else:
-        os.makedirs(_DATA_DIR, exist_ok=True)
-        _save_json(url_list, URLS_FILE)
+        save_json(url_list, URLS_FILE)
+        URLS_PARTIAL_FILE.unlink()
         logger.info("Saved %d URLs to '%s'.", len(url_list), URLS_FILE)
 
     return "done"
 
 
-async def _retry_failed_pages(context, repository=None):
+async def _retry_failed_pages(context, repository=None, concurrency: int = 5):
     """Retry pages that failed during the initial collection pass (standalone mode only)."""
+    global _failed_seen
     if repository is not None:
         return  # Repository mode: retries are handled at URL level, not page level
 
-    if not os.path.exists(FAILED_URLS_FILE):
-        return
-
-    with open(FAILED_URLS_FILE, "r", encoding="utf-8") as f:
-        try:
-            failed_items = json.load(f)
-        except json.JSONDecodeError:
-            failed_items = []
-
+    failed_items = list(dict.fromkeys(_read_jsonl(FAILED_URLS_FILE)))
+    failed_items = [item for item in failed_items if item.startswith("PAGE::")]
     if not failed_items:
         return
 
     logger.info("Retrying %d failed pages...", len(failed_items))
 
-    page = await context.new_page()
-    try:
-        await page.goto(
-            "https://crautos.com/autosusados/",
-            timeout=60000,
-            wait_until="domcontentloaded",
-        )
-        await page.locator(".btn.btn-lg.btn-success").click()
-    except Exception as exc:
-        logger.error("Could not navigate to base page for retries: %s", exc)
-        await page.close()
+    async def open_retry_tab():
+        page = await context.new_page()
+        try:
+            await page.goto(
+                "https://crautos.com/autosusados/",
+                timeout=60000,
+                wait_until="domcontentloaded",
+            )
+            await page.locator(".btn.btn-lg.btn-success").click()
+            return page
+        except Exception as exc:
+            logger.error("Could not navigate to base page for retries: %s", exc)
+            await page.close()
+            return None
+
+    # Same pool-of-tabs layout as _collect_all_urls, opened one at a time
+    retry_pages = []
+    for _ in range(min(concurrency, len(failed_items))):
+        page = await open_retry_tab()
+        if page:
+            retry_pages.append(page)
+    if not retry_pages:
         return
 
-    existing_urls: set[str] = set()
-    if os.path.exists(URLS_FILE):
-        with open(URLS_FILE, "r", encoding="utf-8") as f:
-            try:
-                existing_urls = set(json.load(f))
-            except json.JSONDecodeError:
-                pass
+    # Merge into URLS_FILE once collection finished; before that, into the
+    # partial log, so _collect_all_urls still resumes from everything found
+    collection_done = URLS_FILE.exists()
+    existing_urls: dict[str, str] = {}
+    if collection_done:
+        try:
+            existing_urls = _by_car_id(load_json(URLS_FILE))
+        except json.JSONDecodeError:
+            pass
+    else:
+        existing_urls = _load_partial_urls()
+
+    item_queue: asyncio.Queue[str] = asyncio.Queue()
+    for item in failed_items:
+        item_queue.put_nowait(item)
 
     still_failed: list[str] = []
-    newly_scraped: set[str] = set()
+    newly_scraped: dict[str, str] = {}
 
-    for item in failed_items:
-        if item.startswith("PAGE::"):
+    async def retry_worker(page):
+        while True:
+            try:
+                item = item_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
             page_num_str = item.split("::")[1]
             try:
                 page_num = int(page_num_str)
                 if page_num > 1:
                     async with page.expect_navigation(wait_until="domcontentloaded"):
                         await page.evaluate(f"p('{page_num_str}')")
-                await page.wait_for_selector('a[href^="cardetail.cfm"]', timeout=10000)
-                links = await page.locator('a[href^="cardetail.cfm"]').all()
-                for link in links:
-                    href = await link.get_attribute("href")
-                    if href:
-                        abs_url = urljoin(page.url, href)
-                        if abs_url not in existing_urls and abs_url not in newly_scraped:
-                            newly_scraped.add(abs_url)
+                await page.wait_for_selector(_DETAIL_LINK_SELECTOR, timeout=10000)
+                hrefs = await page.eval_on_selector_all(
+                    _DETAIL_LINK_SELECTOR, _DETAIL_HREFS_JS
+                )
+                newly_scraped.update(_by_car_id(hrefs, existing_urls))
                 logger.info("Retry OK for page %d.", page_num)
             except Exception as exc:
                 logger.error("Retry failed for page %s: %s", page_num_str, exc)
                 still_failed.append(item)
 
+    await asyncio.gather(*(retry_worker(page) for page in retry_pages))
+
     if newly_scraped:
-        all_urls = list(existing_urls | newly_scraped)
-        _save_json(all_urls, URLS_FILE)
+        if collection_done:
+            # Merge in place instead of building a third mapping for the union
+            existing_urls |= newly_scraped
+            save_json(list(existing_urls.values()), URLS_FILE)
+        else:
+            with URLS_PARTIAL_FILE.open("a", encoding="utf-8") as f:
+                f.writelines(json.dumps(url) + "\n" for url in newly_scraped.values())
         logger.info("Added %d URLs from retried pages.", len(newly_scraped))
 
+    _failed_seen = set(still_failed)
     if still_failed:
-        _save_json(still_failed, FAILED_URLS_FILE)
+        _write_jsonl(still_failed, FAILED_URLS_FILE)
     else:
-        os.remove(FAILED_URLS_FILE)
+        FAILED_URLS_FILE.unlink()
         logger.info("All failed pages retried successfully.")
 
-    await page.close()
+    for page in retry_pages:
+        await page.close()
 
 
 # ---------------------------------------------------------------------------
@@ -427,7 +559,7 @@ async def _retry_failed_pages(context, repository=None):
 
 async def main(
     repository=None,
-    headless: bool = False,
+    headless: bool = True,
     run_id: int | None = None,
     shutdown_event: asyncio.Event | None = None,
     concurrency: int = 5,
@@ -440,7 +572,8 @@ async def main(
     repository : ScraperRepository | None
         When provided, URLs are saved to SQLite.  Otherwise, written to JSON.
     headless : bool
-        Whether to launch Chromium in headless mode.
+        Whether to launch Chromium in headless mode (default). Pass False
+        to watch the browser while debugging.
     run_id : int | None
         The active scrape_run ID (required for DB checkpointing when
         repository is not None).
@@ -458,10 +591,11 @@ async def main(
     """
     result = "failed"
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
+        browser = await p.chromium.launch(headless=headless, args=_LAUNCH_ARGS)
         context = await browser.new_context()
+        await _block_unnecessary(context)
 
-        await _retry_failed_pages(context, repository)
+        await _retry_failed_pages(context, repository, concurrency=concurrency)
         result = await _collect_all_urls(
             context,
             concurrency=concurrency,
@@ -480,4 +614,10 @@ async def main(
 
 
 if __name__ == "__main__":
-    asyncio.run(main(headless=False, concurrency=5))
+    asyncio.run(
+        main(
+            headless=os.environ.get("SCRAPER_HEADLESS", "true").lower()
+            not in ("false", "0", "no"),
+            concurrency=5,
+        )
+    )
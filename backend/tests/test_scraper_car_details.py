@@ -0,0 +1,100 @@
+import asyncio
+import pytest
+from data_scrapper.scraper_car_details import BucketedSWA, RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the code under test sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_never_exceeds_rate(clock):
+    """With burst=1, concurrent acquires are spaced at least 1/rate apart."""
+    rate = 4.0
+    limiter = RateLimiter(rate, burst=1, clock=clock.monotonic, sleep=clock.sleep)
+    stamps = []
+
+    async def task():
+        async with limiter:
+            stamps.append(clock.now)
+
+    await asyncio.gather(*(task() for _ in range(12)))
+
+    assert len(stamps) == 12
+    assert stamps[0] == 0.0  # the initial token is available immediately
+    gaps = [b - a for a, b in zip(stamps, stamps[1:])]
+    assert all(gap >= 1 / rate - 1e-9 for gap in gaps)
+    # Over the whole run the throughput stays within the configured rate
+    assert (len(stamps) - 1) / (stamps[-1] - stamps[0]) <= rate + 1e-9
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_does_not_wait_under_budget(clock):
+    """After an idle period an acquire returns without sleeping."""
+    limiter = RateLimiter(2.0, burst=1, clock=clock.monotonic, sleep=clock.sleep)
+    await limiter.acquire()
+    clock.now += 10
+    before = clock.now
+    await limiter.acquire()
+    assert clock.now == before
+
+
+@pytest.mark.parametrize("rate", [0, -1.0])
+def test_rate_limiter_rejects_non_positive_rate(clock, rate):
+    """A zero or negative rate would divide by zero or never refill."""
+    with pytest.raises(ValueError):
+        RateLimiter(rate, clock=clock.monotonic, sleep=clock.sleep)
+
+
+def test_bucketed_swa_argmax_picks_best_average():
+    """argmax compares per-level averages, not sums or sample counts."""
+    swa = BucketedSWA(levels=6, size=10)
+    for t in (4.0, 4.0, 4.0):
+        swa.push(2, t)
+    swa.push(3, 5.0)
+    swa.push(4, 1.0)
+    swa.push(4, 7.0)
+    assert len(swa) == 6
+    assert swa.argmax(1, 5) == 3
+    # Levels outside [lo, hi] are ignored, and empty levels lose to any sample
+    assert swa.argmax(1, 2) == 2
+    assert swa.argmax(4, 5) == 4
+
+
+def test_bucketed_swa_evicts_oldest_sample():
+    """Once the window is full, each push drops the oldest sample's bucket."""
+    swa = BucketedSWA(levels=4, size=3)
+    swa.push(1, 10.0)
+    swa.push(2, 3.0)
+    swa.push(2, 3.0)
+    assert swa.argmax(1, 3) == 1
+
+    swa.push(3, 2.0)  # evicts (1, 10.0)
+    assert len(swa) == 3
+    assert list(swa.window) == [(2, 3.0), (2, 3.0), (3, 2.0)]
+    # Level 1 has no samples left, so it loses to level 2's lower average
+    assert swa.argmax(1, 3) == 2
+    assert swa.argmax(1, 1) == 1  # only candidate, even when empty
+
+    swa.push(3, 8.0)  # evicts one (2, 3.0)
+    assert swa.argmax(1, 3) == 3  # level 3 averages 5.0, level 2 still 3.0
+    swa.push(1, 4.0)  # evicts the other
+    assert list(swa.window) == [(3, 2.0), (3, 8.0), (1, 4.0)]
+    # Level 2 is empty now; level 3 (5.0) still beats level 1 (4.0)
+    assert swa.argmax(1, 3) == 3
+    assert swa.argmax(1, 2) == 1
@@ -0,0 +1,38 @@
+import logging
+from data_scrapper.scraper_pagination_list import _by_car_id
+
+BASE = "https://crautos.com/autosusados/cardetail.cfm"
+
+
+def test_by_car_id_keeps_first_url_per_id():
+    """Links that differ only in other query parameters collapse to one ID."""
+    urls = [
+        f"{BASE}?c=101&p=1",
+        f"{BASE}?p=2&c=101",
+        f"{BASE}?c=202",
+        f"{BASE}?c=202&c=303",  # repeated parameter: the first value wins
+    ]
+    assert _by_car_id(urls) == {"101": f"{BASE}?c=101&p=1", "202": f"{BASE}?c=202"}
+
+
+def test_by_car_id_skips_known_ids():
+    known = {"101": f"{BASE}?c=101"}
+    assert _by_car_id([f"{BASE}?c=101", f"{BASE}?c=202"], known) == {"202": f"{BASE}?c=202"}
+
+
+def test_by_car_id_ignores_fragment():
+    assert _by_car_id([f"{BASE}?c=404#fotos"]) == {"404": f"{BASE}?c=404#fotos"}
+
+
+def test_by_car_id_logs_urls_without_id(caplog):
+    """URLs without a c= value are dropped, and the drop is reported."""
+    urls = [f"{BASE}?c=101", f"{BASE}?c=", f"{BASE}?car=5", f"{BASE}", f"{BASE}#c=7"]
+    with caplog.at_level(logging.WARNING, logger="data_scrapper.scraper_pagination_list"):
+        assert _by_car_id(urls) == {"101": f"{BASE}?c=101"}
+    assert "Dropped 4 URL(s)" in caplog.text
+
+
+def test_by_car_id_silent_when_all_ids_present(caplog):
+    with caplog.at_level(logging.WARNING, logger="data_scrapper.scraper_pagination_list"):
+        _by_car_id([f"{BASE}?c=101", f"{BASE}?c=101"])
+    assert caplog.text == ""